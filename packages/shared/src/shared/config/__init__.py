@@ -27,6 +27,8 @@ class Settings(BaseSettings):
     db_max_overflow: int = 10
     db_pool_timeout: int = 30
     db_pool_recycle: int = 1800
+    db_statement_cache_size: int = 1024
+    db_prepared_statement_cache_size: int = 500
 
     chunk_max_tokens: int = 400
     chunk_overlap_tokens: int = 50
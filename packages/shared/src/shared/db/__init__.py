@@ -1,6 +1,7 @@
 __all__ = [
     "DocumentCreate",
     "DocumentResponse",
+    "DocumentSummary",
     "CollectionCreate",
     "CollectionResponse",
     "CollectionListResponse",
@@ -28,6 +29,7 @@ from .models import (
     CollectionResponse,
     DocumentCreate,
     DocumentResponse,
+    DocumentSummary,
     compute_content_hash,
     init_db,
 )
@@ -7,11 +7,12 @@ from datetime import datetime
 from enum import StrEnum
 
 from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, String, Text, UniqueConstraint, make_url
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncAttrs, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from shared.config import settings
 from shared.constants import DocumentType
 
 
@@ -206,6 +207,18 @@ class DocumentResponse(BaseModel):
     doc_metadata: dict
 
 
+# Listings leave the document body out; open a document to read its content.
+class DocumentSummary(BaseModel):
+    document_id: str
+    collection_id: str
+    title: str
+    content_hash: str
+    document_type: str
+    created_at: datetime
+    updated_at: datetime
+    doc_metadata: dict
+
+
 class ChunkData(BaseModel):
     document_id: str
     chunk_index: int
@@ -306,6 +319,13 @@ class PatTokenListResponse(BaseModel):
 
 
 def get_db_engine(database_url: str, pool_size: int = 5, max_overflow: int = 10):
+    connect_args = {}
+    if make_url(database_url).get_driver_name() == "asyncpg":
+        # Reuse server-side prepared statements (and their plans) per connection
+        connect_args = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        }
     return create_async_engine(
         database_url,
         pool_size=pool_size,
@@ -314,6 +334,7 @@ def get_db_engine(database_url: str, pool_size: int = 5, max_overflow: int = 10)
         pool_recycle=1800,
         pool_pre_ping=True,
         echo=False,
+        connect_args=connect_args,
     )
 
 
@@ -1,8 +1,10 @@
 import hashlib
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
+from functools import cache
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import defer
 
 from shared.config import settings
 from shared.db.models import (
@@ -12,6 +14,7 @@ from shared.db.models import (
     DocumentCreate,
     DocumentModel,
     DocumentResponse,
+    DocumentSummary,
     PatTokenModel,
     Permission,
     Scope,
@@ -27,6 +30,15 @@ from shared.db.models import (
 )
 
 
+def _utcnow() -> datetime:
+    # The DateTime columns hold naive UTC values, so compare against naive UTC.
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+# Listings only show metadata; document bodies stay in the database until one is opened.
+_SKIP_CONTENT = defer(DocumentModel.content, raiseload=True)
+
+
 class DocumentRepository:
     def __init__(self, async_session_factory, collection_id: str | None = None):
         self.async_session = async_session_factory
@@ -103,21 +115,20 @@ class DocumentRepository:
                 doc_metadata=db_doc.doc_metadata or {},
             )
 
-    async def list_all(self, limit: int = 50, offset: int = 0) -> list[DocumentResponse]:
+    async def list_all(self, limit: int = 50, offset: int = 0) -> list[DocumentSummary]:
         async with self.async_session() as session:
             query = select(DocumentModel).order_by(DocumentModel.created_at.desc())
             if self.collection_id:
                 query = query.where(DocumentModel.collection_id == self.collection_id)
 
-            result = await session.execute(query.limit(limit).offset(offset))
+            result = await session.execute(query.options(_SKIP_CONTENT).limit(limit).offset(offset))
             docs = result.scalars().all()
 
             return [
-                DocumentResponse(
+                DocumentSummary(
                     document_id=d.id,
                     collection_id=d.collection_id,
                     title=d.title,
-                    content=d.content,
                     content_hash=d.content_hash,
                     document_type=d.document_type,
                     created_at=d.created_at,
@@ -236,7 +247,7 @@ class DocumentRepository:
 
     async def list_by_collection(
         self, user_id: str, collection_id: str, limit: int = 50, offset: int = 0
-    ) -> list[DocumentResponse]:
+    ) -> list[DocumentSummary]:
         async with self.async_session() as session:
             query = (
                 select(DocumentModel)
@@ -246,15 +257,14 @@ class DocumentRepository:
                 .order_by(DocumentModel.created_at.desc())
             )
 
-            result = await session.execute(query.limit(limit).offset(offset))
+            result = await session.execute(query.options(_SKIP_CONTENT).limit(limit).offset(offset))
             docs = result.scalars().all()
 
             return [
-                DocumentResponse(
+                DocumentSummary(
                     document_id=d.id,
                     collection_id=d.collection_id,
                     title=d.title,
-                    content=d.content,
                     content_hash=d.content_hash,
                     document_type=d.document_type,
                     created_at=d.created_at,
@@ -291,7 +301,7 @@ class DocumentRepository:
 
     async def list_all_for_user(
         self, user_id: str, limit: int = 50, offset: int = 0
-    ) -> list[DocumentResponse]:
+    ) -> list[DocumentSummary]:
         async with self.async_session() as session:
             query = (
                 select(DocumentModel)
@@ -300,15 +310,14 @@ class DocumentRepository:
                 .order_by(DocumentModel.created_at.desc())
             )
 
-            result = await session.execute(query.limit(limit).offset(offset))
+            result = await session.execute(query.options(_SKIP_CONTENT).limit(limit).offset(offset))
             docs = result.scalars().all()
 
             return [
-                DocumentResponse(
+                DocumentSummary(
                     document_id=d.id,
                     collection_id=d.collection_id,
                     title=d.title,
-                    content=d.content,
                     content_hash=d.content_hash,
                     document_type=d.document_type,
                     created_at=d.created_at,
@@ -395,6 +404,19 @@ class UserRepository:
                 created_at=user.created_at,
             )
 
+    async def check_conflicts(self, username: str, email: str) -> tuple[bool, bool]:
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(UserModel.username, UserModel.email)
+                .where(or_(UserModel.username == username, UserModel.email == email))
+                .limit(2)
+            )
+            rows = result.all()
+            return (
+                any(row.username == username for row in rows),
+                any(row.email == email for row in rows),
+            )
+
     async def update(
         self,
         user_id: str,
@@ -430,6 +452,27 @@ class UserRepository:
                 created_at=user.created_at,
             )
 
+    async def promote(self, user_id: str) -> UserResponse | None:
+        async with self.async_session() as session:
+            result = await session.execute(
+                update(UserModel)
+                .where(UserModel.id == user_id, UserModel.is_superuser.is_(False))
+                .values(is_superuser=True)
+                .returning(UserModel)
+            )
+            user = result.scalar_one_or_none()
+            await session.commit()
+            if not user:
+                return None
+            return UserResponse(
+                user_id=user.id,
+                email=user.email,
+                username=user.username,
+                is_active=user.is_active,
+                is_superuser=user.is_superuser,
+                created_at=user.created_at,
+            )
+
     async def delete(self, user_id: str) -> bool:
         async with self.async_session() as session:
             result = await session.execute(select(UserModel).where(UserModel.id == user_id))
@@ -632,6 +675,13 @@ class CollectionRepository:
                 updated_at=collection.updated_at,
             )
 
+    async def count_by_user(self, user_id: str) -> int:
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(func.count(CollectionModel.id)).where(CollectionModel.user_id == user_id)
+            )
+            return result.scalar() or 0
+
     async def get_document_count(self, collection_id: str) -> int:
         async with self.async_session() as session:
             result = await session.execute(
@@ -765,12 +815,20 @@ class CatRepository:
             await session.commit()
             return cat_token.id, key
 
-    async def list_all(self, user_id: str | None = None) -> list[dict]:
+    async def list_all(
+        self,
+        user_id: str | None = None,
+        collection_id: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict]:
         async with self.async_session() as session:
-            query = select(CatModel)
+            query = select(CatModel).order_by(CatModel.created_at.desc())
             if user_id:
                 query = query.where(CatModel.user_id == user_id)
-            result = await session.execute(query)
+            if collection_id:
+                query = query.where(CatModel.collection_id == collection_id)
+            result = await session.execute(query.limit(limit).offset(offset))
             keys = result.scalars().all()
 
             result_list = []
@@ -835,8 +893,34 @@ class CatRepository:
             await session.commit()
             return token.id, new_key
 
-    async def list_by_user(self, user_id: str) -> list[dict]:
-        return await self.list_all(user_id=user_id)
+    async def list_by_user(
+        self,
+        user_id: str,
+        collection_id: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict]:
+        return await self.list_all(
+            user_id=user_id, collection_id=collection_id, limit=limit, offset=offset
+        )
+
+    async def count_by_user(self, user_id: str, collection_id: str | None = None) -> int:
+        async with self.async_session() as session:
+            query = select(func.count(CatModel.id)).where(CatModel.user_id == user_id)
+            if collection_id:
+                query = query.where(CatModel.collection_id == collection_id)
+            result = await session.execute(query)
+            return result.scalar() or 0
+
+    async def count_active_by_user(self, user_id: str) -> int:
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(func.count(CatModel.id)).where(
+                    CatModel.user_id == user_id,
+                    or_(CatModel.expires_at.is_(None), CatModel.expires_at > _utcnow()),
+                )
+            )
+            return result.scalar() or 0
 
 
 class PatTokenRepository:
@@ -996,6 +1080,19 @@ class PatTokenRepository:
     async def list_by_user(self, user_id: str) -> list[dict]:
         return await self.list_all(user_id=user_id)
 
+    async def count_active_by_user(self, user_id: str) -> int:
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(func.count(PatTokenModel.id)).where(
+                    PatTokenModel.user_id == user_id,
+                    or_(
+                        PatTokenModel.expires_at.is_(None),
+                        PatTokenModel.expires_at > _utcnow(),
+                    ),
+                )
+            )
+            return result.scalar() or 0
+
 
 _engine = None
 _async_session_factory = None
@@ -1018,26 +1115,34 @@ def get_async_session_factory():
     return _async_session_factory
 
 
+@cache
+def _get_default_document_repository() -> DocumentRepository:
+    return DocumentRepository(get_async_session_factory())
+
+
 def get_document_repository(collection_id: str | None = None) -> DocumentRepository:
-    async_session = get_async_session_factory()
-    return DocumentRepository(async_session, collection_id)
+    # Collection-scoped repositories carry per-call state, so only the
+    # unscoped one is shared.
+    if collection_id is not None:
+        return DocumentRepository(get_async_session_factory(), collection_id)
+    return _get_default_document_repository()
 
 
+@cache
 def get_cat_repository() -> CatRepository:
-    async_session = get_async_session_factory()
-    return CatRepository(async_session)
+    return CatRepository(get_async_session_factory())
 
 
+@cache
 def get_user_repository() -> UserRepository:
-    async_session = get_async_session_factory()
-    return UserRepository(async_session)
+    return UserRepository(get_async_session_factory())
 
 
+@cache
 def get_collection_repository() -> CollectionRepository:
-    async_session = get_async_session_factory()
-    return CollectionRepository(async_session)
+    return CollectionRepository(get_async_session_factory())
 
 
+@cache
 def get_pat_token_repository() -> PatTokenRepository:
-    async_session = get_async_session_factory()
-    return PatTokenRepository(async_session)
+    return PatTokenRepository(get_async_session_factory())
@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from functools import cache
 from typing import Any
 
 from sqlalchemy import select
@@ -124,6 +125,6 @@ def get_async_session_factory():
     return _async_session_factory
 
 
+@cache
 def get_usage_repository() -> UsageRepository:
-    async_session = get_async_session_factory()
-    return UsageRepository(async_session)
+    return UsageRepository(get_async_session_factory())
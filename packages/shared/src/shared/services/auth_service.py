@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 
 import bcrypt
@@ -33,7 +34,7 @@ class AuthService:
         username: str,
         email: str,
         is_superuser: bool = False,
-        scopes: list[Scope] | list[str] | None = None,
+        scopes: Sequence[Scope] | Sequence[str] | None = None,
     ) -> str:
         if scopes is None:
             scopes = [Scope.READ, Scope.WRITE]
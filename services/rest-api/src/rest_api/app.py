@@ -3,10 +3,12 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
+from rest_api.middleware.etag import ETagMiddleware
 from rest_api.middleware.usage import UsageMiddleware
-from rest_api.routes import admin, auth, cat, collections, documents, pat
+from rest_api.routes import admin, auth, batch, cat, collections, documents, pat, summary
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,12 @@ def create_app() -> FastAPI:
             "AdminApiKey": {"type": "apiKey", "in": "header", "name": "X-Admin-Api-Key"},
         }
 
+    app.add_middleware(ETagMiddleware)
+
+    # Added after the ETag middleware so it wraps it: tags are computed on the plain
+    # body, and 304s have nothing to compress.
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -61,6 +69,8 @@ def create_app() -> FastAPI:
     app.include_router(collections.router, prefix="/api/v1")
     app.include_router(documents.router, prefix="/api/v1")
     app.include_router(admin.router, prefix="/api/v1")
+    app.include_router(batch.router, prefix="/api/v1")
+    app.include_router(summary.router, prefix="/api/v1")
 
     @app.get("/health", include_in_schema=False)
     async def health():
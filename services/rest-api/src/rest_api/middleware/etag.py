@@ -0,0 +1,62 @@
+import hashlib
+from collections.abc import Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+
+# Larger bodies are passed through untagged rather than buffered to be hashed.
+ETAG_MAX_BODY = 1024 * 1024
+# Set on requests whose response is consumed in-process, such as batch sub-calls.
+SKIP_ETAG_SCOPE_KEY = "rest_api.skip_etag"
+
+
+def compute_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # If-None-Match lists tags and compares them weakly, so a W/ prefix is ignored.
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp):
+        super().__init__(app)
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        response = await call_next(request)
+
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or "etag" in response.headers
+            or request.scope.get(SKIP_ETAG_SCOPE_KEY)
+        ):
+            return response
+
+        # Streaming responses carry no Content-Length; only small, complete bodies are hashed.
+        content_length = response.headers.get("content-length")
+        if content_length is None or int(content_length) > ETAG_MAX_BODY:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = compute_etag(body)
+
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        headers = dict(response.headers)
+        headers["ETag"] = etag
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=headers,
+            media_type=response.media_type,
+        )
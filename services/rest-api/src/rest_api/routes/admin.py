@@ -1,6 +1,8 @@
+import asyncio
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query, status
+from pydantic import TypeAdapter
 from shared.db import (
     get_cat_repository,
     get_collection_repository,
@@ -27,6 +29,10 @@ from rest_api.schemas import (
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
+# Validates a whole page of rows in one pydantic-core call instead of one
+# model __init__ per row.
+_user_list_items = TypeAdapter(list[UserListItem])
+
 
 @router.get(
     "/users",
@@ -42,17 +48,7 @@ async def list_users(
     users = await user_repo.list_all(limit=limit, offset=offset)
     total = await user_repo.count_all()
 
-    items = [
-        UserListItem(
-            user_id=u.user_id,
-            email=u.email,
-            username=u.username,
-            is_active=u.is_active,
-            is_superuser=u.is_superuser,
-            created_at=u.created_at,
-        )
-        for u in users
-    ]
+    items = _user_list_items.validate_python(users, from_attributes=True)
 
     return UserListResponse(
         users=items,
@@ -79,17 +75,7 @@ async def search_users(
     user_repo = get_user_repository()
     users = await user_repo.search(query=query, limit=limit, offset=offset)
 
-    items = [
-        UserListItem(
-            user_id=u.user_id,
-            email=u.email,
-            username=u.username,
-            is_active=u.is_active,
-            is_superuser=u.is_superuser,
-            created_at=u.created_at,
-        )
-        for u in users
-    ]
+    items = _user_list_items.validate_python(users, from_attributes=True)
     return UserListResponse(users=items, total=len(users), limit=limit, offset=offset)
 
 
@@ -176,7 +162,9 @@ async def update_user(
     if body.username is not None:
         update_data["username"] = body.username
     if body.password is not None:
-        update_data["password_hash"] = auth_service.hash_password(body.password)
+        update_data["password_hash"] = await asyncio.to_thread(
+            auth_service.hash_password, body.password
+        )
     if body.is_active is not None:
         update_data["is_active"] = body.is_active
     if body.is_superuser is not None:
@@ -263,17 +251,17 @@ async def promote_user(
 ):
     user_repo = get_user_repository()
 
-    user = await user_repo.get_by_id(user_id)
+    # No row comes back when the user is missing or already a superuser.
+    updated = await user_repo.promote(user_id)
+    if updated is None:
+        updated = await user_repo.get_by_id(user_id)
 
-    if not user:
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"code": "USER_NOT_FOUND", "message": "User not found"},
         )
 
-    await user_repo.update(user_id, is_superuser=True)
-
-    updated = await user_repo.get_by_id(user_id)
     return UserResponse(
         user_id=updated.user_id,
         email=updated.email,
@@ -1,10 +1,13 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException, status
 from shared.db import get_user_repository
-from shared.services.auth_service import AuthService
+from shared.services import get_auth_service
 
 from rest_api.deps import DbDep, UserDep
 from rest_api.schemas import (
     ErrorResponse,
+    LoginResponse,
     RefreshRequest,
     TokenResponse,
     UserCreate,
@@ -14,6 +17,9 @@ from rest_api.schemas import (
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+_USER_SCOPES = ("read", "write")
+_ADMIN_SCOPES = ("read", "write", "admin")
+
 
 @router.post(
     "/register",
@@ -29,23 +35,25 @@ async def register(
 ):
 
     user_repo = get_user_repository()
-    auth_service = AuthService()
+    auth_service = get_auth_service()
 
-    existing_user = await user_repo.get_by_username(body.username)
-    if existing_user:
+    # Hash while the conflict query is in flight; a conflict just discards the hash.
+    (username_taken, email_taken), password_hash = await asyncio.gather(
+        user_repo.check_conflicts(body.username, body.email),
+        asyncio.to_thread(auth_service.hash_password, body.password),
+    )
+    if username_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"code": "USERNAME_EXISTS", "message": "Username already registered"},
         )
 
-    existing_email = await user_repo.get_by_email(body.email)
-    if existing_email:
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"code": "EMAIL_EXISTS", "message": "Email already registered"},
         )
 
-    password_hash = auth_service.hash_password(body.password)
     user = await user_repo.create(
         username=body.username,
         email=body.email,
@@ -64,7 +72,7 @@ async def register(
 
 @router.post(
     "/login",
-    response_model=TokenResponse,
+    response_model=LoginResponse,
     responses={
         401: {"model": ErrorResponse, "description": "Invalid credentials"},
         403: {"model": ErrorResponse, "description": "Account disabled"},
@@ -76,7 +84,7 @@ async def login(
 ):
 
     user_repo = get_user_repository()
-    auth_service = AuthService()
+    auth_service = get_auth_service()
 
     user = await user_repo.get_by_username(body.username)
 
@@ -86,7 +94,9 @@ async def login(
             detail={"code": "INVALID_CREDENTIALS", "message": "Wrong username or password"},
         )
 
-    if not auth_service.verify_password(body.password, user["password_hash"]):
+    if not await asyncio.to_thread(
+        auth_service.verify_password, body.password, user["password_hash"]
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={"code": "INVALID_CREDENTIALS", "message": "Wrong username or password"},
@@ -98,24 +108,31 @@ async def login(
             detail={"code": "ACCOUNT_DISABLED", "message": "User account is inactive"},
         )
 
-    scopes = ["read", "write"]
-    if user["is_superuser"]:
-        scopes.append("admin")
+    scopes = _ADMIN_SCOPES if user["is_superuser"] else _USER_SCOPES
 
     access_token = auth_service.create_access_token(
         user_id=user["user_id"],
         username=user["username"],
         email=user["email"],
         is_superuser=user["is_superuser"],
-        scopes=[s for s in scopes],
+        scopes=scopes,
     )
     refresh_token = auth_service.create_refresh_token(user_id=user["user_id"])
 
-    return TokenResponse(
+    # The profile rides along so clients don't need a second round trip after login.
+    return LoginResponse(
         access_token=access_token,
         refresh_token=refresh_token,
         token_type="bearer",
         expires_in=auth_service.get_access_token_expiry(),
+        user=UserResponse(
+            user_id=user["user_id"],
+            email=user["email"],
+            username=user["username"],
+            is_active=user["is_active"],
+            is_superuser=user["is_superuser"],
+            created_at=user["created_at"],
+        ),
     )
 
 
@@ -131,7 +148,7 @@ async def refresh(
     db: DbDep,
 ):
 
-    auth_service = AuthService()
+    auth_service = get_auth_service()
     user_repo = get_user_repository()
 
     payload = auth_service.validate_refresh_token(body.refresh_token)
@@ -148,16 +165,14 @@ async def refresh(
             detail={"code": "INVALID_REFRESH_TOKEN", "message": "User not found or inactive"},
         )
 
-    scopes = ["read", "write"]
-    if user.is_superuser:
-        scopes.append("admin")
+    scopes = _ADMIN_SCOPES if user.is_superuser else _USER_SCOPES
 
     access_token = auth_service.create_access_token(
         user_id=user.user_id,
         username=user.username,
         email=user.email,
         is_superuser=user.is_superuser,
-        scopes=[s for s in scopes],
+        scopes=scopes,
     )
     refresh_token = auth_service.create_refresh_token(user_id=user.user_id)
 
@@ -0,0 +1,156 @@
+import asyncio
+import re
+from typing import Any
+
+import httpx
+from fastapi import APIRouter, HTTPException, Request, status
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from rest_api.deps import UserDep
+from rest_api.middleware.etag import SKIP_ETAG_SCOPE_KEY
+from rest_api.schemas import BatchCall, BatchRequest, BatchResponse, BatchResult, ErrorResponse
+
+router = APIRouter(tags=["Batch"])
+
+# "$<index>.<field>[.<field>...]" points into the JSON body of an earlier call.
+_REFERENCE = re.compile(r"^\$(\d+)\.(.+)$")
+
+
+def resolve_references(value: Any, results: list[BatchResult]) -> Any:
+    if isinstance(value, str):
+        match = _REFERENCE.match(value)
+        if not match:
+            return value
+        index, field_path = int(match[1]), match[2]
+        if index >= len(results) or results[index] is None:
+            raise ValueError(f"Reference '{value}' points at a call that has not run")
+        resolved = results[index].body
+        for key in field_path.split("."):
+            resolved = resolved[int(key)] if isinstance(resolved, list) else resolved[key]
+        return resolved
+    if isinstance(value, dict):
+        return {key: resolve_references(item, results) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_references(item, results) for item in value]
+    return value
+
+
+def referenced_calls(value: Any) -> set[int]:
+    if isinstance(value, str):
+        match = _REFERENCE.match(value)
+        return {int(match[1])} if match else set()
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        return set().union(*(referenced_calls(item) for item in value))
+    return set()
+
+
+def _sub_call_app(app: ASGIApp) -> ASGIApp:
+    async def sub_call(scope: Scope, receive: Receive, send: Send):
+        # Sub-responses are folded into the batch body, so tagging them is wasted work.
+        scope[SKIP_ETAG_SCOPE_KEY] = True
+        await app(scope, receive, send)
+
+    return sub_call
+
+
+async def _dispatch(
+    client: httpx.AsyncClient, call: BatchCall, results: list[BatchResult | None]
+) -> BatchResult:
+    params, payload = call.params, call.body
+    if call.input_from is not None:
+        source = results[call.input_from]
+        if not 200 <= source.status_code < 300:
+            return BatchResult(
+                status_code=status.HTTP_424_FAILED_DEPENDENCY,
+                body={
+                    "detail": {
+                        "code": "BATCH_DEPENDENCY_FAILED",
+                        "message": f"Call {call.input_from} did not succeed",
+                    }
+                },
+            )
+        try:
+            params = resolve_references(params, results)
+            payload = resolve_references(payload, results)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            return BatchResult(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                body={"detail": {"code": "INVALID_BATCH_REFERENCE", "message": str(e)}},
+            )
+
+    response = await client.request(call.method, call.path, params=params, json=payload)
+    return BatchResult(
+        status_code=response.status_code,
+        body=response.json() if response.content else None,
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=BatchResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid batch call"},
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+    },
+)
+async def batch(
+    body: BatchRequest,
+    request: Request,
+    user: UserDep,
+):
+    for index, call in enumerate(body.calls):
+        if not call.path.startswith("/api/v1/") or call.path.startswith("/api/v1/batch"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "INVALID_BATCH_CALL",
+                    "message": f"Call {index} must target an /api/v1 endpoint",
+                },
+            )
+        if call.input_from is not None and not 0 <= call.input_from < index:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "INVALID_BATCH_CALL",
+                    "message": f"Call {index} can only take input from an earlier call",
+                },
+            )
+
+    # Sub-calls run in-process through the full app, with the caller's credentials.
+    # Their bodies are folded into this response, so compressing them would only be
+    # undone again here.
+    headers = {"Accept-Encoding": "identity"}
+    if authorization := request.headers.get("Authorization"):
+        headers["Authorization"] = authorization
+
+    results: list[BatchResult | None] = [None] * len(body.calls)
+
+    async def run(index: int, call: BatchCall, waits: list[asyncio.Task]):
+        await asyncio.gather(*waits)
+        results[index] = await _dispatch(client, call, results)
+
+    # Calls run concurrently unless one takes input from another. Writes keep their
+    # order: a write waits for every earlier call, and later calls wait for it.
+    transport = httpx.ASGITransport(app=_sub_call_app(request.app), raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport, base_url=str(request.base_url), headers=headers
+    ) as client:
+        tasks: list[asyncio.Task] = []
+        last_write: asyncio.Task | None = None
+        for index, call in enumerate(body.calls):
+            if call.method != "GET":
+                waits = list(tasks)
+            else:
+                waits = [last_write] if last_write else []
+                if call.input_from is not None:
+                    refs = referenced_calls([call.params, call.body]) | {call.input_from}
+                    waits += [tasks[ref] for ref in refs if ref < index]
+            task = asyncio.create_task(run(index, call, waits))
+            tasks.append(task)
+            if call.method != "GET":
+                last_write = task
+        await asyncio.gather(*tasks)
+
+    return BatchResponse(results=results)
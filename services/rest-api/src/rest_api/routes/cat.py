@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query, status
+from pydantic import TypeAdapter
 from shared.db import get_cat_repository, get_collection_repository
 from shared.db.models import Permission as ModelPermission
 
@@ -15,6 +16,14 @@ from rest_api.schemas import (
 
 router = APIRouter(prefix="/auth/cat", tags=["CAT Management"])
 
+# Repository rows carry the model Permission enum, which validates by value.
+_cat_list_items = TypeAdapter(list[CatListItem])
+
+_PERMISSION_VALUES = {
+    ModelPermission.READ_WRITE: "read_write",
+    ModelPermission.READ: "read",
+}
+
 
 @router.post(
     "",
@@ -86,31 +95,22 @@ async def list_cats(
     db: DbDep,
     user: UserDep,
     collection_id: str | None = Query(None, description="Filter by collection"),
+    limit: int | None = Query(None, ge=1, le=100, description="Page size; omit to list all"),
+    offset: int = Query(0, ge=0),
 ):
     cat_repo = get_cat_repository()
 
-    if collection_id:
-        cats = await cat_repo.list_by_user(user.user_id)
-        cats = [cat for cat in cats if cat.get("collection_id") == collection_id]
+    cats = await cat_repo.list_by_user(
+        user.user_id, collection_id=collection_id, limit=limit, offset=offset
+    )
+    if limit is None and not offset:
+        total = len(cats)
     else:
-        cats = await cat_repo.list_by_user(user.user_id)
-
-    items = [
-        CatListItem(
-            cat_id=cat["cat_id"],
-            label=cat["label"],
-            collection_id=cat["collection_id"],
-            collection_name=cat.get("collection_name"),
-            permission="read_write"
-            if cat.get("permission") == ModelPermission.READ_WRITE
-            else "read",
-            created_at=cat["created_at"],
-            expires_at=cat.get("expires_at"),
-        )
-        for cat in cats
-    ]
+        total = await cat_repo.count_by_user(user.user_id, collection_id)
 
-    return CatListResponse(tokens=items)
+    return CatListResponse(
+        tokens=_cat_list_items.validate_python(cats), total=total, limit=limit, offset=offset
+    )
 
 
 @router.post(
@@ -194,9 +194,7 @@ async def rotate_cat(
         token=new_token,
         collection_id=new_cat["collection_id"],
         collection_name=collection["name"] if collection else None,
-        permission="read_write"
-        if new_cat.get("permission") == ModelPermission.READ_WRITE
-        else "read",
+        permission=_PERMISSION_VALUES.get(new_cat.get("permission"), "read"),
         created_at=new_cat["created_at"],
         expires_at=new_cat.get("expires_at"),
     )
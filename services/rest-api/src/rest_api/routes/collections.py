@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, status
+from pydantic import TypeAdapter
 from shared.db import get_collection_repository
 from shared.db.qdrant import get_qdrant_service
 
@@ -15,6 +16,8 @@ from rest_api.schemas import (
 
 router = APIRouter(prefix="/collections", tags=["Collections"])
 
+_collection_list_items = TypeAdapter(list[CollectionListItem])
+
 
 @router.post(
     "",
@@ -54,18 +57,7 @@ async def list_collections(
     collection_repo = get_collection_repository()
     collections = await collection_repo.list_by_user(user.user_id)
 
-    items = [
-        CollectionListItem(
-            collection_id=collection["collection_id"],
-            name=collection["name"],
-            document_count=collection.get("document_count", 0),
-            cat_count=collection.get("cat_count", 0),
-            created_at=collection["created_at"],
-        )
-        for collection in collections
-    ]
-
-    return CollectionListResponse(collections=items)
+    return CollectionListResponse(collections=_collection_list_items.validate_python(collections))
 
 
 @router.get(
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, status
+from pydantic import TypeAdapter
 from shared.db import get_pat_token_repository, get_user_repository
 from shared.db.models import generate_pat_token
 
@@ -15,6 +16,8 @@ from rest_api.schemas import (
 
 router = APIRouter(prefix="/auth/pat", tags=["PAT Management"])
 
+_pat_list_items = TypeAdapter(list[PatListItem])
+
 
 @router.post(
     "",
@@ -79,20 +82,7 @@ async def list_pats(
     pat_repo = get_pat_token_repository()
     pats = await pat_repo.list_by_user(user.user_id)
 
-    tokens = [
-        PatListItem(
-            pat_id=pat["pat_id"],
-            label=pat["label"],
-            user_id=pat["user_id"],
-            scopes=pat["scopes"],
-            created_at=pat["created_at"],
-            expires_at=pat["expires_at"],
-            last_used=pat["last_used"],
-        )
-        for pat in pats
-    ]
-
-    return PatListResponse(tokens=tokens)
+    return PatListResponse(tokens=_pat_list_items.validate_python(pats))
 
 
 @router.post(
@@ -0,0 +1,36 @@
+import asyncio
+
+from fastapi import APIRouter
+from shared.db import (
+    get_cat_repository,
+    get_collection_repository,
+    get_document_repository,
+    get_pat_token_repository,
+)
+
+from rest_api.deps import DbDep, UserDep
+from rest_api.schemas import ErrorResponse, SummaryResponse
+
+router = APIRouter(tags=["Summary"])
+
+
+@router.get(
+    "/summary",
+    response_model=SummaryResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+    },
+)
+async def get_summary(
+    db: DbDep,
+    user: UserDep,
+):
+    # Counts only, so dashboards don't download full listings to call len() on them.
+    # Each repository opens its own session, so the counts can run side by side.
+    collections, documents, pats, cats = await asyncio.gather(
+        get_collection_repository().count_by_user(user.user_id),
+        get_document_repository().count_by_user(user.user_id),
+        get_pat_token_repository().count_active_by_user(user.user_id),
+        get_cat_repository().count_active_by_user(user.user_id),
+    )
+    return SummaryResponse(collections=collections, documents=documents, pats=pats, cats=cats)
@@ -1,7 +1,8 @@
 from datetime import datetime
 from enum import StrEnum
+from typing import Any, Literal
 
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from shared.constants import DocumentType
 
 
@@ -43,6 +44,10 @@ class UserResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class LoginResponse(TokenResponse):
+    user: UserResponse
+
+
 class UserDetailResponse(UserResponse):
     collection_count: int = 0
     pat_active_count: int = 0
@@ -236,6 +241,9 @@ class CatListItem(BaseModel):
 
 class CatListResponse(BaseModel):
     tokens: list[CatListItem]
+    total: int
+    limit: int | None = None
+    offset: int = 0
 
 
 class PatCreate(BaseModel):
@@ -330,3 +338,31 @@ class UsageHistoryItem(BaseModel):
 
 class UsageHistoryResponse(BaseModel):
     history: list[UsageHistoryItem]
+
+
+class SummaryResponse(BaseModel):
+    collections: int
+    documents: int
+    pats: int
+    cats: int
+
+
+class BatchCall(BaseModel):
+    method: Literal["GET", "POST", "PATCH", "DELETE"] = "GET"
+    path: str
+    body: Any = Field(None, alias="json")
+    params: dict[str, Any] | None = None
+    input_from: int | None = None
+
+
+class BatchRequest(BaseModel):
+    calls: list[BatchCall] = Field(min_length=1, max_length=20)
+
+
+class BatchResult(BaseModel):
+    status_code: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchResult]
@@ -1,18 +1,80 @@
+import asyncio
 import os
+import random
+import time
+from collections import OrderedDict
 
 import httpx
+import orjson
+from nicegui import app
 
-API_HOSTNAME = os.environ.get("API_HOSTNAME")
-
+from web_ui.utils import js_string
 
-class ApiClient:
+API_HOSTNAME = os.environ.get("API_HOSTNAME")
+API_SOCKET_PATH = os.environ.get("API_SOCKET_PATH")
+ETAG_CACHE_SIZE = 128
+SESSION_CLIENTS = 1024
+COLLECTIONS_TTL = 15.0
+REQUEST_ATTEMPTS = 3
+
+# Errors after which a request can be resent. Writes only retry when the connection
+# never opened, so a request the API may have applied is not sent twice.
+_IDEMPOTENT_RETRY_ERRORS = (httpx.ConnectError, httpx.RemoteProtocolError, httpx.ReadTimeout)
+_WRITE_RETRY_ERRORS = (httpx.ConnectError,)
+
+# POSTs that only exchange credentials and write nothing a cached read depends on.
+_NON_WRITING_POSTS = frozenset(
+    {"/api/v1/auth/login", "/api/v1/auth/refresh", "/api/v1/auth/register"}
+)
+
+
+def parse_json(response: httpx.Response):
+    return orjson.loads(response.content)
+
+
+def _create_http_client(socket_path: str | None = None) -> httpx.AsyncClient:
+    # Limits and HTTP/2 live on the transport; the client ignores them once one is given.
+    # retries=1 re-attempts a failed connect instead of surfacing a TCP reset.
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=1,
+        uds=socket_path,
+        limits=httpx.Limits(
+            max_keepalive_connections=32, max_connections=100, keepalive_expiry=60.0
+        ),
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=5.0),
+    )
+
+
+class AsyncApiClient:
     _cached_origin: str | None = None
 
-    def __init__(self, hostname: str | None = None):
+    def __init__(
+        self,
+        hostname: str | None = None,
+        socket_path: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         self._hostname = hostname or API_HOSTNAME
-        self._client = httpx.Client(timeout=30.0)
+        # A co-located API can be reached over a UNIX socket, skipping the TCP stack.
+        # The host in the URL then only fills the Host header.
+        socket_path = socket_path or API_SOCKET_PATH
+        if socket_path:
+            self._hostname = "http://localhost"
+        # Tokens and caches belong to this client; the connection pool may be shared, in
+        # which case whoever created it closes it.
+        self._owns_client = http_client is None
+        self._client = http_client or _create_http_client(socket_path)
         self.access_token: str | None = None
         self.refresh_token: str | None = None
+        self._auth_header: str | None = None
+        self._etag_cache: OrderedDict[tuple, tuple[str, bytes, dict]] = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Task[httpx.Response]] = {}
+        self._refreshing: dict[str, asyncio.Task[httpx.Response]] = {}
+        self._collections_cache: dict[str | None, tuple[float, httpx.Response]] = {}
 
     @classmethod
     def set_cached_origin(cls, origin: str):
@@ -27,10 +89,9 @@ class ApiClient:
         self._hostname = value
 
     def _get_url(self, path: str) -> str:
-        if self._hostname:
-            return f"{self._hostname}{path}"
-        if self._cached_origin:
-            return f"{self._cached_origin}{path}"
+        base = self._hostname or self._cached_origin
+        if base:
+            return base + path
         raise RuntimeError(
             "API_HOSTNAME not set and browser origin not available. "
             "Ensure the page has loaded before making API calls."
@@ -39,108 +100,240 @@ class ApiClient:
     def set_tokens(self, access_token: str, refresh_token: str):
         self.access_token = access_token
         self.refresh_token = refresh_token
+        self._auth_header = f"Bearer {access_token}"
 
     def clear_tokens(self):
         self.access_token = None
         self.refresh_token = None
+        self._auth_header = None
+        self._etag_cache.clear()
+        self.invalidate_collections_cache()
 
-    def _get_headers(self) -> dict:
-        headers = {"Content-Type": "application/json"}
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-        return headers
+    def _cached_response(
+        self, key: tuple, cached: tuple[str, bytes, dict] | None, response: httpx.Response
+    ) -> httpx.Response:
+        # A 304 answers the ETag that was sent, so it is served from the entry read
+        # then; the cache may have dropped that entry while the request was in flight.
+        if response.status_code == 304 and cached is not None:
+            if key in self._etag_cache:
+                self._etag_cache.move_to_end(key)
+            _, content, headers = cached
+            return httpx.Response(200, headers=headers, content=content, request=response.request)
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            headers = {"Content-Type": response.headers.get("Content-Type", ""), "ETag": etag}
+            self._etag_cache[key] = (etag, response.content, headers)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return response
 
-    def _request(
+    def _invalidate_cached(self, path: str):
+        resource = "/".join(path.split("/")[:4])
+        for key in [key for key in self._etag_cache if key[0].startswith(resource)]:
+            del self._etag_cache[key]
+
+    def _invalidate_written(self, path: str, json: dict | None):
+        if path in _NON_WRITING_POSTS:
+            return
+        # A batch only writes what its non-GET calls target; a read-only batch keeps
+        # every cached read.
+        if path == "/api/v1/batch" and json is not None:
+            paths = [c["path"] for c in json.get("calls", []) if c.get("method", "GET") != "GET"]
+        else:
+            paths = [path]
+        for written in paths:
+            self._invalidate_cached(written)
+        if paths:
+            # Document and token writes change the per-collection counts as well.
+            self.invalidate_collections_cache()
+
+    async def _request(
         self,
         method: str,
         path: str,
         json: dict | None = None,
         params: dict | None = None,
         retry_on_401: bool = True,
+    ) -> httpx.Response:
+        if method != "GET":
+            return await self._send(method, path, json, params, retry_on_401)
+
+        # Identical GETs issued while one is already on the wire share its response.
+        # The token is part of the key so a refreshed session never joins a stale call.
+        key = (path, tuple(sorted((params or {}).items())), self.access_token, retry_on_401)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, path, json, params, retry_on_401))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield() keeps one cancelled caller from cancelling the call for the others.
+        return await asyncio.shield(task)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        json: dict | None,
+        params: dict | None,
+        retry_on_401: bool,
     ) -> httpx.Response:
         url = self._get_url(path)
-        response = self._client.request(
-            method=method,
-            url=url,
-            json=json,
-            params=params,
-            headers=self._get_headers(),
+
+        content = None
+        headers = {}
+        # The pool may be shared between sessions, so the token goes on each request.
+        if self._auth_header:
+            headers["Authorization"] = self._auth_header
+        if json is not None:
+            content = orjson.dumps(json)
+            headers["Content-Type"] = "application/json"
+
+        # GETs revalidate against a cached ETag; writes drop cached reads of the resource.
+        cache_key = None
+        cached = None
+        if method == "GET":
+            cache_key = (path, tuple(sorted((params or {}).items())))
+            if cached := self._etag_cache.get(cache_key):
+                headers["If-None-Match"] = cached[0]
+        else:
+            self._invalidate_written(path, json)
+
+        retry_errors = (
+            _IDEMPOTENT_RETRY_ERRORS if method in ("GET", "DELETE") else _WRITE_RETRY_ERRORS
         )
+        for attempt in range(REQUEST_ATTEMPTS):
+            try:
+                response = await self._client.request(
+                    method=method,
+                    url=url,
+                    content=content,
+                    params=params,
+                    headers=headers,
+                )
+                break
+            except retry_errors:
+                if attempt == REQUEST_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(random.uniform(0, 0.05 * 2**attempt))
 
         # Handle expired tokens automatically
         if response.status_code == 401 and retry_on_401 and self.refresh_token:
-            refresh_res = self.refresh(self.refresh_token)
+            refresh_res = await self._refresh_once(self.refresh_token)
             if refresh_res.status_code == 200:
-                data = refresh_res.json()
-                self.set_tokens(data["access_token"], data["refresh_token"])
-
-                # Attempt to update storage if we are in a NiceGUI context
-                try:
-                    from nicegui import ui
-
-                    ui.run_javascript(
-                        f"localStorage.setItem('access_token', '{data['access_token']}')"
-                    )
-                    ui.run_javascript(
-                        f"localStorage.setItem('refresh_token', '{data['refresh_token']}')"
-                    )
-                except Exception:
-                    pass
-
                 # Retry original request with new token
-                return self._request(method, path, json, params, retry_on_401=False)
+                return await self._request(method, path, json, params, retry_on_401=False)
+            if refresh_res.status_code == 401:
+                # The refresh token is dead; stop paying a refresh round trip per call.
+                self.refresh_token = None
 
+        if cache_key is not None:
+            return self._cached_response(cache_key, cached, response)
         return response
 
-    def register(self, username: str, email: str, password: str) -> httpx.Response:
-        return self._request(
+    def _refresh_once(self, refresh_token: str) -> asyncio.Task[httpx.Response]:
+        # Calls that hit an expired token together share one refresh instead of each
+        # minting and storing its own token pair.
+        task = self._refreshing.get(refresh_token)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh_and_store(refresh_token))
+            self._refreshing[refresh_token] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(refresh_token, None))
+        return task
+
+    async def _refresh_and_store(self, refresh_token: str) -> httpx.Response:
+        response = await self.refresh(refresh_token)
+        if response.status_code == 200:
+            data = parse_json(response)
+            self.set_tokens(data["access_token"], data["refresh_token"])
+
+            # Attempt to update storage if we are in a NiceGUI context
+            try:
+                from nicegui import ui
+
+                ui.run_javascript(
+                    f"localStorage.setItem('access_token', {js_string(data['access_token'])});"
+                    f"localStorage.setItem('refresh_token', {js_string(data['refresh_token'])})"
+                )
+            except Exception:
+                pass
+        return response
+
+    async def refresh(self, refresh_token: str) -> httpx.Response:
+        return await self._request(
+            "POST",
+            "/api/v1/auth/refresh",
+            json={"refresh_token": refresh_token},
+            retry_on_401=False,
+        )
+
+    async def get_document(self, document_id: str) -> httpx.Response:
+        return await self._request("GET", f"/api/v1/documents/{document_id}")
+
+    def invalidate_collections_cache(self):
+        self._collections_cache.clear()
+
+    async def list_collections(self) -> httpx.Response:
+        # Every page lists collections; reuse a fresh listing instead of asking again.
+        key = self.access_token
+        cached = self._collections_cache.get(key)
+        if cached and time.monotonic() - cached[0] < COLLECTIONS_TTL:
+            return cached[1]
+
+        response = await self._request("GET", "/api/v1/collections")
+        if response.status_code == 200:
+            self._collections_cache[key] = (time.monotonic(), response)
+            if len(self._collections_cache) > ETAG_CACHE_SIZE:
+                del self._collections_cache[next(iter(self._collections_cache))]
+        return response
+
+    async def batch(self, calls: list[dict]) -> httpx.Response:
+        return await self._request("POST", "/api/v1/batch", json={"calls": calls})
+
+    async def register(self, username: str, email: str, password: str) -> httpx.Response:
+        return await self._request(
             "POST",
             "/api/v1/auth/register",
             json={"username": username, "email": email, "password": password},
         )
 
-    def login(self, username: str, password: str) -> httpx.Response:
-        return self._request(
+    async def login(self, username: str, password: str) -> httpx.Response:
+        return await self._request(
             "POST",
             "/api/v1/auth/login",
             json={"username": username, "password": password},
         )
 
-    def refresh(self, refresh_token: str) -> httpx.Response:
-        return self._request(
-            "POST",
-            "/api/v1/auth/refresh",
-            json={"refresh_token": refresh_token},
-            retry_on_401=False,
-        )
-
-    def get_profile(self) -> httpx.Response:
-        return self._request("GET", "/api/v1/auth/profile")
+    async def get_profile(self) -> httpx.Response:
+        return await self._request("GET", "/api/v1/auth/profile")
 
-    def list_collections(self) -> httpx.Response:
-        return self._request("GET", "/api/v1/collections")
+    async def get_summary(self) -> httpx.Response:
+        return await self._request("GET", "/api/v1/summary")
 
-    def create_collection(self, name: str) -> httpx.Response:
-        return self._request("POST", "/api/v1/collections", json={"name": name})
+    async def create_collection(self, name: str) -> httpx.Response:
+        return await self._request("POST", "/api/v1/collections", json={"name": name})
 
-    def get_collection(self, collection_id: str) -> httpx.Response:
-        return self._request("GET", f"/api/v1/collections/{collection_id}")
+    async def get_collection(self, collection_id: str) -> httpx.Response:
+        return await self._request("GET", f"/api/v1/collections/{collection_id}")
 
-    def rename_collection(self, collection_id: str, name: str) -> httpx.Response:
-        return self._request("PATCH", f"/api/v1/collections/{collection_id}", json={"name": name})
+    async def rename_collection(self, collection_id: str, name: str) -> httpx.Response:
+        return await self._request(
+            "PATCH", f"/api/v1/collections/{collection_id}", json={"name": name}
+        )
 
-    def delete_collection(self, collection_id: str) -> httpx.Response:
-        return self._request("DELETE", f"/api/v1/collections/{collection_id}")
+    async def delete_collection(self, collection_id: str) -> httpx.Response:
+        return await self._request("DELETE", f"/api/v1/collections/{collection_id}")
 
-    def list_documents(
+    async def list_documents(
         self, collection_id: str | None = None, limit: int = 50, offset: int = 0
     ) -> httpx.Response:
         params: dict = {"limit": limit, "offset": offset}
         if collection_id:
             params["collection_id"] = collection_id
-        return self._request("GET", "/api/v1/documents", params=params)
+        return await self._request("GET", "/api/v1/documents", params=params)
 
-    def create_document(
+    async def create_document(
         self,
         title: str,
         content: str,
@@ -148,7 +341,7 @@ class ApiClient:
         document_type: str = "markdown",
         metadata: dict | None = None,
     ) -> httpx.Response:
-        return self._request(
+        return await self._request(
             "POST",
             "/api/v1/documents",
             json={
@@ -160,10 +353,7 @@ class ApiClient:
             },
         )
 
-    def get_document(self, document_id: str) -> httpx.Response:
-        return self._request("GET", f"/api/v1/documents/{document_id}")
-
-    def update_document(
+    async def update_document(
         self,
         document_id: str,
         title: str | None = None,
@@ -180,24 +370,24 @@ class ApiClient:
             body["document_type"] = document_type
         if metadata is not None:
             body["metadata"] = metadata
-        return self._request("PATCH", f"/api/v1/documents/{document_id}", json=body)
+        return await self._request("PATCH", f"/api/v1/documents/{document_id}", json=body)
 
-    def delete_document(self, document_id: str) -> httpx.Response:
-        return self._request("DELETE", f"/api/v1/documents/{document_id}")
+    async def delete_document(self, document_id: str) -> httpx.Response:
+        return await self._request("DELETE", f"/api/v1/documents/{document_id}")
 
-    def list_pats(self) -> httpx.Response:
-        return self._request("GET", "/api/v1/auth/pat")
+    async def list_pats(self) -> httpx.Response:
+        return await self._request("GET", "/api/v1/auth/pat")
 
-    def create_pat(self, label: str, expires_in_days: int | None = None) -> httpx.Response:
+    async def create_pat(self, label: str, expires_in_days: int | None = None) -> httpx.Response:
         body: dict = {"label": label}
         if expires_in_days is not None:
             body["expires_in_days"] = expires_in_days
-        return self._request("POST", "/api/v1/auth/pat", json=body)
+        return await self._request("POST", "/api/v1/auth/pat", json=body)
 
-    def delete_pat(self, pat_id: str) -> httpx.Response:
-        return self._request("POST", f"/api/v1/auth/pat/{pat_id}/delete")
+    async def delete_pat(self, pat_id: str) -> httpx.Response:
+        return await self._request("POST", f"/api/v1/auth/pat/{pat_id}/delete")
 
-    def rotate_pat(
+    async def rotate_pat(
         self, pat_id: str, label: str | None = None, expires_in_days: int | None = None
     ) -> httpx.Response:
         body: dict = {}
@@ -205,17 +395,23 @@ class ApiClient:
             body["label"] = label
         if expires_in_days is not None:
             body["expires_in_days"] = expires_in_days
-        return self._request(
+        return await self._request(
             "POST", f"/api/v1/auth/pat/{pat_id}/rotate", json=body if body else None
         )
 
-    def list_cats(self, collection_id: str | None = None) -> httpx.Response:
+    async def list_cats(
+        self, collection_id: str | None = None, limit: int | None = None, offset: int = 0
+    ) -> httpx.Response:
+        # Without a limit the API returns every CAT, as it did before paging existed.
         params: dict = {}
         if collection_id:
             params["collection_id"] = collection_id
-        return self._request("GET", "/api/v1/auth/cat", params=params)
+        if limit is not None:
+            params["limit"] = limit
+            params["offset"] = offset
+        return await self._request("GET", "/api/v1/auth/cat", params=params)
 
-    def create_cat(
+    async def create_cat(
         self,
         label: str,
         collection_id: str,
@@ -229,12 +425,12 @@ class ApiClient:
         }
         if expires_in_days is not None:
             body["expires_in_days"] = expires_in_days
-        return self._request("POST", "/api/v1/auth/cat", json=body)
+        return await self._request("POST", "/api/v1/auth/cat", json=body)
 
-    def delete_cat(self, cat_id: str) -> httpx.Response:
-        return self._request("POST", f"/api/v1/auth/cat/{cat_id}/delete")
+    async def delete_cat(self, cat_id: str) -> httpx.Response:
+        return await self._request("POST", f"/api/v1/auth/cat/{cat_id}/delete")
 
-    def rotate_cat(
+    async def rotate_cat(
         self, cat_id: str, label: str | None = None, expires_in_days: int | None = None
     ) -> httpx.Response:
         body: dict = {}
@@ -242,19 +438,19 @@ class ApiClient:
             body["label"] = label
         if expires_in_days is not None:
             body["expires_in_days"] = expires_in_days
-        return self._request(
+        return await self._request(
             "POST", f"/api/v1/auth/cat/{cat_id}/rotate", json=body if body else None
         )
 
-    def list_users(self, limit: int = 50, offset: int = 0) -> httpx.Response:
-        return self._request(
+    async def list_users(self, limit: int = 50, offset: int = 0) -> httpx.Response:
+        return await self._request(
             "GET", "/api/v1/admin/users", params={"limit": limit, "offset": offset}
         )
 
-    def get_user(self, user_id: str) -> httpx.Response:
-        return self._request("GET", f"/api/v1/admin/users/{user_id}")
+    async def get_user(self, user_id: str) -> httpx.Response:
+        return await self._request("GET", f"/api/v1/admin/users/{user_id}")
 
-    def update_user(
+    async def update_user(
         self,
         user_id: str,
         email: str | None = None,
@@ -274,21 +470,63 @@ class ApiClient:
             body["is_active"] = is_active
         if is_superuser is not None:
             body["is_superuser"] = is_superuser
-        return self._request("PATCH", f"/api/v1/admin/users/{user_id}", json=body)
+        return await self._request("PATCH", f"/api/v1/admin/users/{user_id}", json=body)
 
-    def delete_user(self, user_id: str) -> httpx.Response:
-        return self._request("DELETE", f"/api/v1/admin/users/{user_id}")
+    async def delete_user(self, user_id: str) -> httpx.Response:
+        return await self._request("DELETE", f"/api/v1/admin/users/{user_id}")
 
-    def get_user_usage(self, user_id: str, year_month: str = None) -> httpx.Response:
+    async def get_user_usage(self, user_id: str, year_month: str = None) -> httpx.Response:
         params = {}
         if year_month:
             params["year_month"] = year_month
-        return self._request("GET", f"/api/v1/admin/usage/{user_id}", params=params)
+        return await self._request("GET", f"/api/v1/admin/usage/{user_id}", params=params)
 
-    def get_user_usage_history(self, user_id: str, months: int = 6) -> httpx.Response:
-        return self._request(
+    async def get_user_usage_history(self, user_id: str, months: int = 6) -> httpx.Response:
+        return await self._request(
             "GET", f"/api/v1/admin/usage/{user_id}/history", params={"months": months}
         )
 
-    def close(self):
-        self._client.close()
+    async def aclose(self):
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+_http_client: httpx.AsyncClient | None = None
+_sessions: OrderedDict[str, AsyncApiClient] = OrderedDict()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = _create_http_client(API_SOCKET_PATH)
+    return _http_client
+
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_client() -> AsyncApiClient:
+    # One client per browser session: tokens and cached responses never cross users,
+    # while every session reuses the same connection pool. Tabs of a browser share
+    # their tokens through localStorage, so they share the client too.
+    session_id = app.storage.browser["id"]
+    client = _sessions.get(session_id)
+    if client is None:
+        client = AsyncApiClient(http_client=get_http_client())
+        _sessions[session_id] = client
+        # An evicted session only loses its caches; the next page load sets its tokens again.
+        if len(_sessions) > SESSION_CLIENTS:
+            _sessions.popitem(last=False)
+    else:
+        _sessions.move_to_end(session_id)
+    return client
@@ -3,6 +3,7 @@ import os
 from nicegui import app, ui
 from shared.config import settings
 
+from web_ui.api_client import close_http_client
 from web_ui.pages import (  # noqa: E402
     admin_router,
     auth_router,
@@ -15,6 +16,7 @@ from web_ui.pages import (  # noqa: E402
 )
 
 STATIC_PATH = os.path.join(os.path.dirname(__file__), "static")
+app.on_shutdown(close_http_client)
 app.add_static_files("/static", STATIC_PATH)
 
 
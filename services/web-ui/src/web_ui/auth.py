@@ -1,46 +1,83 @@
+import base64
+import json
+import time
+
 from nicegui import app, ui
 
-from web_ui.api_client import API_HOSTNAME, ApiClient
+from web_ui.api_client import AsyncApiClient, get_client, parse_json
+from web_ui.utils import js_string
 
-api_client = ApiClient(hostname=API_HOSTNAME)
+# How long a stored profile is trusted before it is fetched again.
+PROFILE_TTL = 300
 
 
-async def set_api_origin():
+def _token_subject(access_token: str | None) -> str | None:
+    # The payload is read unverified: it only decides whether the cached profile
+    # belongs to this token. The API still verifies the token on every call.
     try:
-        origin = await ui.run_javascript("window.location.origin")
-        if origin:
-            ApiClient.set_cached_origin(origin)
-    except TimeoutError:
-        pass
+        payload = access_token.split(".")[1]
+        return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))["sub"]
+    except AttributeError, IndexError, KeyError, TypeError, ValueError:
+        return None
+
+
+async def load_profile() -> int:
+    storage = app.storage.user
+    profile = storage.get("user")
+    if (
+        profile
+        and time.time() - storage.get("user_cached_at", 0) < PROFILE_TTL
+        and profile.get("user_id") == _token_subject(get_client().access_token)
+    ):
+        return 200
+
+    response = await get_client().get_profile()
+    if response.status_code == 200:
+        store_profile(parse_json(response))
+    return response.status_code
 
 
-async def load_tokens_from_storage():
-    await set_api_origin()
+def store_profile(profile: dict):
+    app.storage.user["user"] = profile
+    app.storage.user["user_cached_at"] = time.time()
+
+
+def invalidate_profile(user_id: str | None = None):
+    profile = get_user()
+    if profile and user_id in (None, profile.get("user_id")):
+        app.storage.user.pop("user", None)
+        app.storage.user.pop("user_cached_at", None)
+
 
+# Everything a page load needs from the browser, fetched in one round trip: the
+# origin for API calls and the tokens after any due refresh.
+_LOAD_TOKENS_JS = """
+(async () => {
+    const hadToken = !!localStorage.getItem('access_token');
+    const accessToken = await window.__forceRefreshToken();
+    return {
+        origin: window.location.origin,
+        had_token: hadToken,
+        access_token: accessToken,
+        refresh_token: localStorage.getItem('refresh_token'),
+    };
+})()
+"""
+
+
+async def load_tokens_from_storage():
     try:
-        # Load tokens from storage
-        access_token = await ui.run_javascript("localStorage.getItem('access_token')")
-        refresh_token = await ui.run_javascript("localStorage.getItem('refresh_token')")
-
-        if access_token:
-            api_client.set_tokens(access_token, refresh_token)
-
-        # Force refresh and wait for the result to avoid race conditions
-        refreshed_token = await ui.run_javascript("window.__forceRefreshToken()")
-
-        if refreshed_token:
-            # Refresh token might have been updated as well
-            latest_refresh_token = await ui.run_javascript("localStorage.getItem('refresh_token')")
-            api_client.set_tokens(refreshed_token, latest_refresh_token)
-
-            profile_response = api_client.get_profile()
-            if profile_response.status_code == 200:
-                profile = profile_response.json()
-                app.storage.user["is_superuser"] = profile.get("is_superuser", False)
-            elif profile_response.status_code == 401:
+        state = await ui.run_javascript(_LOAD_TOKENS_JS)
+        if state.get("origin"):
+            AsyncApiClient.set_cached_origin(state["origin"])
+
+        if state.get("access_token"):
+            get_client().set_tokens(state["access_token"], state["refresh_token"])
+
+            if await load_profile() == 401:
                 # If profile fails after refresh, tokens are likely invalid
                 await logout()
-        elif access_token:
+        elif state.get("had_token"):
             # We had an access token but refresh failed (expired refresh token)
             await logout()
 
@@ -52,30 +89,33 @@ async def load_tokens_from_storage():
 
 async def save_tokens_to_storage(access_token: str, refresh_token: str):
     try:
-        await ui.run_javascript(f"localStorage.setItem('access_token', '{access_token}')")
-        await ui.run_javascript(f"localStorage.setItem('refresh_token', '{refresh_token}')")
+        await ui.run_javascript(
+            f"localStorage.setItem('access_token', {js_string(access_token)});"
+            f"localStorage.setItem('refresh_token', {js_string(refresh_token)})"
+        )
     except TimeoutError:
         pass
 
 
 async def clear_tokens_from_storage():
     try:
-        await ui.run_javascript("localStorage.removeItem('access_token')")
-        await ui.run_javascript("localStorage.removeItem('refresh_token')")
+        await ui.run_javascript(
+            "localStorage.removeItem('access_token');localStorage.removeItem('refresh_token')"
+        )
     except TimeoutError:
         pass
 
 
 def get_user():
-    return None
+    return app.storage.user.get("user")
 
 
 def is_logged_in():
-    return bool(api_client.access_token)
+    return bool(get_client().access_token)
 
 
 def is_admin():
-    return app.storage.user.get("is_superuser", False)
+    return (get_user() or {}).get("is_superuser", False)
 
 
 def require_auth():
@@ -95,21 +135,21 @@ def require_admin():
 
 
 async def logout():
-    api_client.clear_tokens()
+    get_client().clear_tokens()
+    invalidate_profile()
     await clear_tokens_from_storage()
     ui.navigate.to("/login")
 
 
 async def login_user(username: str, password: str) -> tuple[bool, str]:
-    response = api_client.login(username, password)
+    api_client = get_client()
+    response = await api_client.login(username, password)
     if response.status_code == 200:
-        data = response.json()
+        data = parse_json(response)
         api_client.set_tokens(data["access_token"], data["refresh_token"])
         await save_tokens_to_storage(data["access_token"], data["refresh_token"])
-        profile_response = api_client.get_profile()
-        if profile_response.status_code == 200:
-            profile = profile_response.json()
-            app.storage.user["is_superuser"] = profile.get("is_superuser", False)
+        # The login response carries the profile, so no separate fetch is needed.
+        store_profile(data["user"])
         return True, ""
     elif response.status_code == 401:
         return False, "Invalid username or password"
@@ -120,11 +160,11 @@ async def login_user(username: str, password: str) -> tuple[bool, str]:
 
 
 async def register_user(username: str, email: str, password: str) -> tuple[bool, str]:
-    response = api_client.register(username, email, password)
+    response = await get_client().register(username, email, password)
     if response.status_code == 201:
         return True, ""
     elif response.status_code == 400:
-        detail = response.json().get("detail", {})
+        detail = parse_json(response).get("detail", {})
         code = detail.get("code", "")
         if code == "USERNAME_EXISTS":
             return False, "Username already exists"
@@ -134,7 +174,3 @@ async def register_user(username: str, email: str, password: str) -> tuple[bool,
             return False, detail.get("message", "Registration failed")
     else:
         return False, f"Registration failed: {response.status_code}"
-
-
-def get_api_client() -> ApiClient:
-    return api_client
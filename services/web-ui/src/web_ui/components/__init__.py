@@ -1,11 +1,15 @@
 from web_ui.components.common import (
     add_table_action_buttons,
     build_sort_url,
+    cached_collection_options,
     confirm_action,
     create_sort_handler,
     create_table_pagination,
+    get_collection_options,
+    invalidate_collection_options,
     make_columns_sortable,
     mcp_token_dialog,
+    store_collection_options,
 )
 from web_ui.components.layout import render_page
 from web_ui.components.navbar import render_nav
@@ -20,4 +24,8 @@ __all__ = [
     "create_table_pagination",
     "build_sort_url",
     "create_sort_handler",
+    "cached_collection_options",
+    "store_collection_options",
+    "invalidate_collection_options",
+    "get_collection_options",
 ]
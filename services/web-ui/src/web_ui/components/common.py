@@ -1,7 +1,13 @@
 import asyncio
+import time
 from collections.abc import Callable
 
-from nicegui import ui
+from nicegui import app, ui
+
+from web_ui.api_client import parse_json
+from web_ui.utils import js_string
+
+COLLECTION_OPTIONS_TTL = 30
 
 
 def make_columns_sortable(columns: list[dict], exclude: list[str] | None = None) -> list[dict]:
@@ -23,6 +29,37 @@ def create_table_pagination(
     return pagination
 
 
+def cached_collection_options() -> dict | None:
+    """Return this session's collection select options if they are still fresh."""
+    cached = app.storage.user.get("_collections_opts")
+    if cached and time.time() - cached["ts"] < COLLECTION_OPTIONS_TTL:
+        return dict(cached["opts"])
+    return None
+
+
+def store_collection_options(collections: list[dict]) -> dict:
+    """Build collection select options and keep them in the session."""
+    opts = {"__all__": "All Collections"}
+    opts.update({c["collection_id"]: c["name"] for c in collections})
+    app.storage.user["_collections_opts"] = {"ts": time.time(), "opts": opts}
+    return opts
+
+
+def invalidate_collection_options():
+    """Drop the session's collection select options after collections change."""
+    app.storage.user.pop("_collections_opts", None)
+
+
+async def get_collection_options(api_client) -> dict:
+    """Collection select options, fetched only when the session has none fresh."""
+    if (opts := cached_collection_options()) is not None:
+        return opts
+    response = await api_client.list_collections()
+    if response.status_code != 200:
+        return {"__all__": "All Collections"}
+    return store_collection_options(parse_json(response).get("collections", []))
+
+
 def build_sort_url(
     base_url: str,
     sort_by: str,
@@ -71,26 +108,31 @@ async def confirm_action(
     confirm_label: str = "Confirm",
     color: str = "negative",
 ):
-    async def handle_confirm():
-        dialog.close()
-        if asyncio.iscoroutinefunction(on_confirm):
-            await on_confirm()
-        else:
-            on_confirm()
-
     with ui.dialog() as dialog, ui.card():
         ui.label(title).classes("text-lg font-bold")
         ui.label(message).classes("text-sm text-grey-7")
         with ui.row().classes("w-full justify-end gap-2"):
-            ui.button(cancel_label, on_click=dialog.close).props("flat")
+            ui.button(cancel_label, on_click=lambda: dialog.submit(False)).props("flat")
             ui.button(
                 confirm_label,
-                on_click=handle_confirm,
+                on_click=lambda: dialog.submit(True),
             ).props(f"color={color}")
-    dialog.open()
 
+    # Dismissing the dialog resolves to None. Dialogs live in the page layout, so
+    # drop this one once answered rather than leaving one behind per confirmation.
+    confirmed = await dialog
+    dialog.delete()
+    if not confirmed:
+        return
+    if asyncio.iscoroutinefunction(on_confirm):
+        await on_confirm()
+    else:
+        on_confirm()
 
-async def mcp_token_dialog(token: str, title: str = "Token Created"):
+
+async def mcp_token_dialog(
+    token: str, title: str = "Token Created", on_close: Callable | None = None
+):
     origin = await ui.run_javascript("window.location.origin")
     mcp_url = f"{origin}/mcp"
     with ui.dialog() as dialog, ui.card().classes("w-[500px]"):
@@ -116,13 +158,17 @@ async def mcp_token_dialog(token: str, title: str = "Token Created"):
         with ui.row().classes("w-full justify-end gap-2"):
             ui.button(
                 "Copy",
-                on_click=lambda: ui.navigate.to(
-                    f"javascript:navigator.clipboard.writeText('{token}')"
+                on_click=lambda: ui.run_javascript(
+                    f"navigator.clipboard.writeText({js_string(token)})"
                 ),
             ).props("flat")
-            ui.button("Close", on_click=lambda: [dialog.close(), ui.navigate.reload()]).props(
-                "color=primary"
-            )
+
+            async def close():
+                dialog.close()
+                if on_close:
+                    await on_close()
+
+            ui.button("Close", on_click=close).props("color=primary")
     dialog.open()
 
 
@@ -1,3 +1,4 @@
+import inspect
 import os
 
 from nicegui import ui
@@ -15,10 +16,13 @@ with open(JS_PATH) as f:
     TOKEN_REFRESH_JS = f.read()
 
 
-def render_page(content_fn):
+async def render_page(content_fn):
     ui.add_css(CSS, shared=True)
     ui.add_head_html(f"<script>{TOKEN_REFRESH_JS}</script>", shared=True)
     with ui.column().classes("w-full max-w-6xl mx-auto p-4"):
         render_nav()
         with ui.card().classes("w-full mt-4"):
-            content_fn()
+            # Pages that only lay out elements can pass a plain function.
+            result = content_fn()
+            if inspect.isawaitable(result):
+                await result
@@ -1,6 +1,6 @@
 from nicegui import ui
 
-from web_ui.auth import get_user, is_admin, is_logged_in, logout
+from web_ui.auth import get_user, is_logged_in, logout
 
 
 def render_nav():
@@ -10,7 +10,9 @@ def render_nav():
             ui.label("Ainstruct").classes("text-xl font-bold")
         with ui.row().classes("items-center gap-4"):
             if is_logged_in():
-                if is_admin():
+                # One storage read serves both the admin check and the greeting.
+                user = get_user() or {}
+                if user.get("is_superuser", False):
                     ui.button("Admin", on_click=lambda: ui.navigate.to("/admin")).props("flat")
                 ui.button("Dashboard", on_click=lambda: ui.navigate.to("/dashboard")).props("flat")
                 ui.button("Collections", on_click=lambda: ui.navigate.to("/collections")).props(
@@ -18,7 +20,6 @@ def render_nav():
                 )
                 ui.button("Documents", on_click=lambda: ui.navigate.to("/documents")).props("flat")
                 ui.button("Tokens", on_click=lambda: ui.navigate.to("/tokens")).props("flat")
-                user = get_user()
                 if user:
                     ui.label(f"Hello, {user.get('username', 'User')}").classes("text-sm")
                 ui.button("Logout", on_click=logout).props("flat color=negative")
@@ -1,7 +1,10 @@
+import asyncio
+
 from nicegui import APIRouter, ui
 from shared.config import settings
 
-from web_ui.auth import load_tokens_from_storage, require_admin
+from web_ui.api_client import get_client, parse_json
+from web_ui.auth import invalidate_profile, load_tokens_from_storage, require_admin
 from web_ui.components import (
     add_table_action_buttons,
     build_sort_url,
@@ -14,6 +17,55 @@ from web_ui.utils import format_date, handle_api_error
 
 router = APIRouter(prefix="")
 
+# Column definitions are built once and shared by every render; tables only read them.
+_HISTORY_COLUMNS = [
+    {"name": "month", "label": "Month", "field": "month", "align": "left"},
+    {"name": "api", "label": "API", "field": "api", "align": "center"},
+    {"name": "mcp", "label": "MCP", "field": "mcp", "align": "center"},
+    {"name": "total", "label": "Total", "field": "total", "align": "center"},
+]
+
+_USER_COLUMNS = make_columns_sortable(
+    [
+        {"name": "username", "label": "Username", "field": "username", "align": "left"},
+        {"name": "email", "label": "Email", "field": "email", "align": "left"},
+        {"name": "is_active", "label": "Status", "field": "is_active", "align": "center"},
+        {
+            "name": "is_superuser",
+            "label": "Role",
+            "field": "is_superuser",
+            "align": "center",
+        },
+        {"name": "created_at", "label": "Created", "field": "created_at", "align": "left"},
+        {"name": "actions", "label": "Actions", "field": "actions", "align": "center"},
+    ]
+)
+
+
+# Status and role are sent as booleans and rendered as badges in the browser.
+_STATUS_SLOT = """<q-td :props="props">
+    <q-badge :color="props.value ? 'positive' : 'negative'">
+        {{ props.value ? 'Active' : 'Inactive' }}
+    </q-badge>
+</q-td>"""
+
+_ROLE_SLOT = """<q-td :props="props">
+    <q-badge :color="props.value ? 'purple' : 'grey'">
+        {{ props.value ? 'Superuser' : 'User' }}
+    </q-badge>
+</q-td>"""
+
+
+def _row_from_user(u: dict) -> dict:
+    return {
+        "id": u["user_id"],
+        "username": u["username"],
+        "email": u.get("email", ""),
+        "is_active": u.get("is_active", True),
+        "is_superuser": u.get("is_superuser", False),
+        "created_at": format_date(u.get("created_at")),
+    }
+
 
 @router.page("/admin")
 async def admin_page(offset: int = 0, sort_by: str = "", sort_desc: bool = False):
@@ -24,10 +76,8 @@ async def admin_page(offset: int = 0, sort_by: str = "", sort_desc: bool = False
 
     limit = settings.web_records_per_page
 
-    def content():
-        from web_ui.auth import get_api_client
-
-        api_client = get_api_client()
+    async def content():
+        api_client = get_client()
 
         ui.label("User Administration").classes("text-2xl font-bold mb-4")
 
@@ -62,25 +112,19 @@ async def admin_page(offset: int = 0, sort_by: str = "", sort_desc: bool = False
                             ui.label("Total").classes("text-xs text-grey-7")
                     ui.label("History").classes("text-lg font-semibold mt-2")
                     history_table = ui.table(
-                        columns=[
-                            {"name": "month", "label": "Month", "field": "month", "align": "left"},
-                            {"name": "api", "label": "API", "field": "api", "align": "center"},
-                            {"name": "mcp", "label": "MCP", "field": "mcp", "align": "center"},
-                            {
-                                "name": "total",
-                                "label": "Total",
-                                "field": "total",
-                                "align": "center",
-                            },
-                        ],
+                        columns=_HISTORY_COLUMNS,
                         rows=[],
                         row_key="month",
                     ).classes("w-full")
 
         async def show_user_stats(user_id: int, username: str, is_active: bool = True):
-            response = api_client.get_user(str(user_id))
+            response, usage_response, history_response = await asyncio.gather(
+                api_client.get_user(str(user_id)),
+                api_client.get_user_usage(str(user_id)),
+                api_client.get_user_usage_history(str(user_id), months=6),
+            )
             if response.status_code == 200:
-                user = response.json()
+                user = parse_json(response)
                 stats_user_label.set_text(f"👤 {username}")
                 stats_status_badge.set_text("Active" if is_active else "Inactive")
                 stats_status_badge.props(f"color={'positive' if is_active else 'negative'}")
@@ -93,9 +137,8 @@ async def admin_page(offset: int = 0, sort_by: str = "", sort_desc: bool = False
                 cat_inactive = user.get("cat_inactive_count", 0)
                 stats_cats.set_text(f"🔐 CATs: {cat_active} active, {cat_inactive} inactive")
 
-                usage_response = api_client.get_user_usage(str(user_id))
                 if usage_response.status_code == 200:
-                    usage = usage_response.json()
+                    usage = parse_json(usage_response)
                     stats_api_label.set_text(str(usage.get("api_requests", 0)))
                     stats_mcp_label.set_text(str(usage.get("mcp_requests", 0)))
                     stats_total_label.set_text(str(usage.get("total_requests", 0)))
@@ -104,9 +147,8 @@ async def admin_page(offset: int = 0, sort_by: str = "", sort_desc: bool = False
                     stats_mcp_label.set_text("0")
                     stats_total_label.set_text("0")
 
-                history_response = api_client.get_user_usage_history(str(user_id), months=6)
                 if history_response.status_code == 200:
-                    history_data = history_response.json()
+                    history_data = parse_json(history_response)
                     history_rows = [
                         {
                             "month": h.get("year_month", ""),
@@ -124,192 +166,179 @@ async def admin_page(offset: int = 0, sort_by: str = "", sort_desc: bool = False
             else:
                 ui.notify(f"Error loading user stats: {response.text}", type="negative")
 
-        async def toggle_active(user_id: int, current_active: bool):
-            response = api_client.update_user(str(user_id), is_active=not current_active)
-            if handle_api_error(response, "Failed to update user"):
-                ui.notify(f"User {'activated' if not current_active else 'deactivated'}")
-                ui.navigate.reload()
+        # The rendered table and total, so edits can patch the page instead of refetching it.
+        shown = {}
 
-        async def toggle_superuser(user_id: int, current_superuser: bool):
-            response = api_client.update_user(str(user_id), is_superuser=not current_superuser)
+        async def update_user(user_id: int, message: str, **changes):
+            response = await api_client.update_user(str(user_id), **changes)
             if handle_api_error(response, "Failed to update user"):
-                ui.notify(
-                    f"User {'promoted to' if not current_superuser else 'demoted from'} superuser"
+                invalidate_profile(str(user_id))
+                ui.notify(message)
+                user = parse_json(response)
+                table = shown["table"]
+                table.update_rows(
+                    [_row_from_user(user) if r["id"] == user["user_id"] else r for r in table.rows]
                 )
-                ui.navigate.reload()
+
+        def toggle_active(user_id: int, current_active: bool):
+            return update_user(
+                user_id,
+                f"User {'activated' if not current_active else 'deactivated'}",
+                is_active=not current_active,
+            )
+
+        def toggle_superuser(user_id: int, current_superuser: bool):
+            return update_user(
+                user_id,
+                f"User {'promoted to' if not current_superuser else 'demoted from'} superuser",
+                is_superuser=not current_superuser,
+            )
 
         async def delete_user(user_id: int, username: str):
-            response = api_client.delete_user(str(user_id))
+            response = await api_client.delete_user(str(user_id))
             if handle_api_error(response, "Failed to delete user"):
                 ui.notify(f"User '{username}' deleted successfully", type="positive")
-                ui.navigate.reload()
-
-        columns = make_columns_sortable(
-            [
-                {"name": "username", "label": "Username", "field": "username", "align": "left"},
-                {"name": "email", "label": "Email", "field": "email", "align": "left"},
-                {"name": "is_active", "label": "Status", "field": "is_active", "align": "center"},
-                {
-                    "name": "is_superuser",
-                    "label": "Role",
-                    "field": "is_superuser",
-                    "align": "center",
-                },
-                {"name": "created_at", "label": "Created", "field": "created_at", "align": "left"},
-                {"name": "actions", "label": "Actions", "field": "actions", "align": "center"},
-            ]
-        )
+                table = shown["table"]
+                table.remove_rows([{"id": user_id}])
+                # An emptied page is refetched so the totals and pager match the API again.
+                if not table.rows:
+                    await user_list.refresh()
+                    return
+                shown["total"] -= 1
+                user_count_label.set_text(f"Total users: {shown['total']}")
 
         pagination = {"rowsPerPage": limit, **create_table_pagination(sort_by, sort_desc)}
 
-        rows = []
-        total = 0
-        current_offset = offset
-
-        response = api_client.list_users(limit=limit, offset=offset)
-        if response.status_code == 200:
-            data = response.json()
-            users = data.get("users", [])
-            total = data.get("total", 0)
-            current_offset = data.get("offset", 0)
-
-            user_count_label.set_text(f"Total users: {total}")
-
-            for u in users:
-                rows.append(
-                    {
-                        "id": u["user_id"],
-                        "username": u["username"],
-                        "email": u.get("email", ""),
-                        "is_active": u.get("is_active", True),
-                        "is_superuser": u.get("is_superuser", False),
-                        "created_at": format_date(u.get("created_at")),
-                    }
+        # User edits re-fetch and re-render only the current page of users.
+        @ui.refreshable
+        async def user_list():
+            rows = []
+            total = 0
+            current_offset = offset
+
+            shown.clear()
+            response = await api_client.list_users(limit=limit, offset=offset)
+            if response.status_code == 200:
+                data = parse_json(response)
+                users = data.get("users", [])
+                total = data.get("total", 0)
+                current_offset = data.get("offset", 0)
+
+                user_count_label.set_text(f"Total users: {total}")
+
+                rows = [_row_from_user(u) for u in users]
+
+                def handle_stats(item):
+                    user_id = item["id"]
+                    username = item.get("username", "")
+                    is_active = item.get("is_active", True)
+                    return show_user_stats(user_id, username, is_active)
+
+                def handle_toggle_active(item):
+                    user_id = item["id"]
+                    is_active = item.get("is_active", True)
+                    return toggle_active(user_id, is_active)
+
+                def handle_toggle_superuser(item):
+                    user_id = item["id"]
+                    is_superuser = item.get("is_superuser", False)
+                    return toggle_superuser(user_id, is_superuser)
+
+                def handle_delete_user(item):
+                    user_id = item["id"]
+                    username = item.get("username", "")
+                    return delete_user(user_id, username)
+
+                table = ui.table(
+                    columns=_USER_COLUMNS, rows=rows, row_key="id", pagination=pagination
+                ).classes("w-full")
+                shown.update(table=table, total=total)
+
+                table.on(
+                    "update:pagination",
+                    create_sort_handler(
+                        "/admin", lambda: {"offset": current_offset}, sort_by, sort_desc
+                    ),
                 )
 
-            def handle_stats(item):
-                user_id = item["id"]
-                username = item.get("username", "")
-                is_active = item.get("is_active", True)
-                return show_user_stats(user_id, username, is_active)
-
-            def handle_toggle_active(item):
-                user_id = item["id"]
-                is_active = item.get("is_active", True)
-                return toggle_active(user_id, is_active)
-
-            def handle_toggle_superuser(item):
-                user_id = item["id"]
-                is_superuser = item.get("is_superuser", False)
-                return toggle_superuser(user_id, is_superuser)
-
-            def handle_delete_user(item):
-                user_id = item["id"]
-                username = item.get("username", "")
-                return delete_user(user_id, username)
-
-            table = ui.table(
-                columns=columns, rows=rows, row_key="id", pagination=pagination
-            ).classes("w-full")
-
-            table.on(
-                "update:pagination",
-                create_sort_handler(
-                    "/admin", lambda: {"offset": current_offset}, sort_by, sort_desc
-                ),
-            )
+                table.add_slot("body-cell-is_active", _STATUS_SLOT)
+                table.add_slot("body-cell-is_superuser", _ROLE_SLOT)
 
-            table.add_slot(
-                "body-cell-is_active",
-                """<q-td :props="props">
-                    <q-badge :color="props.value ? 'positive' : 'negative'">
-                        {{ props.value ? 'Active' : 'Inactive' }}
-                    </q-badge>
-                </q-td>""",
-            )
+                add_table_action_buttons(
+                    table,
+                    "actions",
+                    [
+                        {
+                            "icon": "analytics",
+                            "color": "primary",
+                            "tooltip": "View user stats",
+                            "on_click": handle_stats,
+                            "label_field": "username",
+                        },
+                        {
+                            "icon": "block",
+                            "color": "warning",
+                            "tooltip": "Toggle active status",
+                            "on_click": handle_toggle_active,
+                            "label_field": "username",
+                            "extra_fields": {"is_active": "is_active"},
+                            "confirm": True,
+                            "confirm_message": "This will change {name} active status.",
+                            "confirm_label": "Toggle Status",
+                        },
+                        {
+                            "icon": "admin_panel_settings",
+                            "color": "purple",
+                            "tooltip": "Change superuser role",
+                            "on_click": handle_toggle_superuser,
+                            "label_field": "username",
+                            "extra_fields": {"is_superuser": "is_superuser"},
+                            "confirm": True,
+                            "confirm_message": "This will change {name} superuser privileges.",
+                            "confirm_label": "Change Role",
+                        },
+                        {
+                            "icon": "delete",
+                            "color": "negative",
+                            "tooltip": "Delete user",
+                            "on_click": handle_delete_user,
+                            "label_field": "username",
+                            "confirm": True,
+                            "confirm_message": "This will permanently delete user '{name}'. This action cannot be undone.",
+                            "confirm_label": "Delete User",
+                        },
+                    ],
+                )
 
-            table.add_slot(
-                "body-cell-is_superuser",
-                """<q-td :props="props">
-                    <q-badge :color="props.value ? 'purple' : 'grey'">
-                        {{ props.value ? 'Superuser' : 'User' }}
-                    </q-badge>
-                </q-td>""",
-            )
+                current_page = (current_offset // limit) + 1
+                total_pages = (total + limit - 1) // limit
+                pagination_label.set_text(f"Page {current_page} of {total_pages}")
+
+                with ui.row().classes("w-full justify-center gap-2 mt-4"):
+                    if current_offset > 0:
+                        ui.button(
+                            "Previous",
+                            on_click=lambda: ui.navigate.to(
+                                build_sort_url(
+                                    "/admin",
+                                    sort_by,
+                                    sort_desc,
+                                    {"offset": max(0, current_offset - limit)},
+                                )
+                            ),
+                        ).props("flat")
+                    if current_offset + limit < total:
+                        ui.button(
+                            "Next",
+                            on_click=lambda: ui.navigate.to(
+                                build_sort_url(
+                                    "/admin", sort_by, sort_desc, {"offset": current_offset + limit}
+                                )
+                            ),
+                        ).props("flat")
+            else:
+                ui.notify(f"Error loading users: {response.text}", type="negative")
 
-            add_table_action_buttons(
-                table,
-                "actions",
-                [
-                    {
-                        "icon": "analytics",
-                        "color": "primary",
-                        "tooltip": "View user stats",
-                        "on_click": handle_stats,
-                        "label_field": "username",
-                    },
-                    {
-                        "icon": "block",
-                        "color": "warning",
-                        "tooltip": "Toggle active status",
-                        "on_click": handle_toggle_active,
-                        "label_field": "username",
-                        "extra_fields": {"is_active": "is_active"},
-                        "confirm": True,
-                        "confirm_message": "This will change {name} active status.",
-                        "confirm_label": "Toggle Status",
-                    },
-                    {
-                        "icon": "admin_panel_settings",
-                        "color": "purple",
-                        "tooltip": "Change superuser role",
-                        "on_click": handle_toggle_superuser,
-                        "label_field": "username",
-                        "extra_fields": {"is_superuser": "is_superuser"},
-                        "confirm": True,
-                        "confirm_message": "This will change {name} superuser privileges.",
-                        "confirm_label": "Change Role",
-                    },
-                    {
-                        "icon": "delete",
-                        "color": "negative",
-                        "tooltip": "Delete user",
-                        "on_click": handle_delete_user,
-                        "label_field": "username",
-                        "confirm": True,
-                        "confirm_message": "This will permanently delete user '{name}'. This action cannot be undone.",
-                        "confirm_label": "Delete User",
-                    },
-                ],
-            )
+        await user_list()
 
-            current_page = (current_offset // limit) + 1
-            total_pages = (total + limit - 1) // limit
-            pagination_label.set_text(f"Page {current_page} of {total_pages}")
-
-            with ui.row().classes("w-full justify-center gap-2 mt-4"):
-                if current_offset > 0:
-                    ui.button(
-                        "Previous",
-                        on_click=lambda: ui.navigate.to(
-                            build_sort_url(
-                                "/admin",
-                                sort_by,
-                                sort_desc,
-                                {"offset": max(0, current_offset - limit)},
-                            )
-                        ),
-                    ).props("flat")
-                if current_offset + limit < total:
-                    ui.button(
-                        "Next",
-                        on_click=lambda: ui.navigate.to(
-                            build_sort_url(
-                                "/admin", sort_by, sort_desc, {"offset": current_offset + limit}
-                            )
-                        ),
-                    ).props("flat")
-        else:
-            ui.notify(f"Error loading users: {response.text}", type="negative")
-
-    render_page(content)
+    await render_page(content)
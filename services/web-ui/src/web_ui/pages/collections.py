@@ -1,11 +1,13 @@
 from nicegui import APIRouter, ui
 from shared.config import settings
 
+from web_ui.api_client import get_client, parse_json
 from web_ui.auth import load_tokens_from_storage, require_auth
 from web_ui.components import (
     add_table_action_buttons,
     create_sort_handler,
     create_table_pagination,
+    invalidate_collection_options,
     make_columns_sortable,
     render_page,
 )
@@ -13,6 +15,46 @@ from web_ui.utils import format_date, handle_api_error
 
 router = APIRouter(prefix="")
 
+_COLLECTION_COLUMNS = make_columns_sortable(
+    [
+        {"name": "name", "label": "Name", "field": "name", "align": "left"},
+        {
+            "name": "document_count",
+            "label": "Documents",
+            "field": "document_count",
+            "align": "left",
+        },
+        {
+            "name": "cat_count",
+            "label": "CATs",
+            "field": "cat_count",
+            "align": "left",
+        },
+        {
+            "name": "created_at",
+            "label": "Created",
+            "field": "created_at",
+            "align": "left",
+        },
+        {
+            "name": "actions",
+            "label": "Actions",
+            "field": "actions",
+            "align": "center",
+        },
+    ]
+)
+
+
+def _row_from_collection(c: dict) -> dict:
+    return {
+        "name": c["name"],
+        "document_count": c.get("document_count", 0),
+        "cat_count": c.get("cat_count", 0),
+        "created_at": format_date(c.get("created_at")),
+        "id": c["collection_id"],
+    }
+
 
 @router.page("/collections")
 async def collections_page(sort_by: str = "", sort_desc: bool = False):
@@ -21,133 +63,114 @@ async def collections_page(sort_by: str = "", sort_desc: bool = False):
     if not require_auth():
         return
 
-    def content():
-        from web_ui.auth import get_api_client
-
-        api_client = get_api_client()
+    async def content():
+        api_client = get_client()
 
         ui.label("Collections").classes("text-2xl font-bold")
 
         with ui.row().classes("w-full gap-2 mb-4"):
             new_name_input = ui.input("New Collection Name").classes("flex-1")
 
-            def create_collection():
+            async def create_collection():
                 if new_name_input.value:
-                    response = api_client.create_collection(new_name_input.value)
+                    response = await api_client.create_collection(new_name_input.value)
                     if handle_api_error(response, "Failed to create collection"):
+                        invalidate_collection_options()
                         ui.notify("Collection created")
                         new_name_input.set_value("")
-                        ui.navigate.reload()
+                        # Add the new row in place; only the empty state needs a re-render.
+                        table = shown.get("table")
+                        if table is not None:
+                            table.add_row(_row_from_collection(parse_json(response)))
+                        else:
+                            await collection_list.refresh()
 
             ui.button("Create", on_click=create_collection).props("color=primary")
 
-        response = api_client.list_collections()
-        if response.status_code == 200:
-            collections = response.json().get("collections", [])
-            if collections:
-                with ui.card().classes("w-full"):
-                    columns = make_columns_sortable(
-                        [
-                            {"name": "name", "label": "Name", "field": "name", "align": "left"},
-                            {
-                                "name": "document_count",
-                                "label": "Documents",
-                                "field": "document_count",
-                                "align": "left",
-                            },
-                            {
-                                "name": "cat_count",
-                                "label": "CATs",
-                                "field": "cat_count",
-                                "align": "left",
-                            },
-                            {
-                                "name": "created_at",
-                                "label": "Created",
-                                "field": "created_at",
-                                "align": "left",
-                            },
-                            {
-                                "name": "actions",
-                                "label": "Actions",
-                                "field": "actions",
-                                "align": "center",
-                            },
-                        ]
-                    )
-
-                    pagination = create_table_pagination(
-                        sort_by, sort_desc, settings.web_records_per_page
-                    )
-
-                    rows = []
-                    for c in collections:
-                        rows.append(
-                            {
-                                "name": c["name"],
-                                "document_count": c.get("document_count", 0),
-                                "cat_count": c.get("cat_count", 0),
-                                "created_at": format_date(c.get("created_at")),
-                                "id": c["collection_id"],
-                            }
+        # Creating or deleting a collection re-renders only this list, not the page.
+        shown = {}
+
+        @ui.refreshable
+        async def collection_list():
+            shown.pop("table", None)
+            response = await api_client.list_collections()
+            if response.status_code == 200:
+                collections = parse_json(response).get("collections", [])
+                if collections:
+                    with ui.card().classes("w-full"):
+                        columns = _COLLECTION_COLUMNS
+
+                        pagination = create_table_pagination(
+                            sort_by, sort_desc, settings.web_records_per_page
                         )
 
-                    def handle_view(e):
-                        collection_id = e.args[1]["id"]
-                        ui.navigate.to(f"/documents?collection_id={collection_id}")
-
-                    async def _delete_collection(item_id: str):
-                        response = api_client.delete_collection(item_id)
-                        if handle_api_error(response, "Failed to delete collection"):
-                            ui.notify("Collection deleted")
-                            ui.navigate.reload()
-
-                    def handle_delete(item):
-                        item_id = item["id"]
-                        return _delete_collection(item_id)
-
-                    table = (
-                        ui.table(columns=columns, rows=rows, row_key="id", pagination=pagination)
-                        .classes("w-full")
-                        .on("rowClick", handle_view)
-                        .on(
-                            "update:pagination",
-                            create_sort_handler("/collections", None, sort_by, sort_desc),
+                        rows = [_row_from_collection(c) for c in collections]
+
+                        def handle_view(e):
+                            collection_id = e.args[1]["id"]
+                            ui.navigate.to(f"/documents?collection_id={collection_id}")
+
+                        async def _delete_collection(item_id: str):
+                            response = await api_client.delete_collection(item_id)
+                            if handle_api_error(response, "Failed to delete collection"):
+                                invalidate_collection_options()
+                                ui.notify("Collection deleted")
+                                # Drop the row locally; re-render only for the empty state.
+                                table.remove_rows([{"id": item_id}])
+                                if not table.rows:
+                                    await collection_list.refresh()
+
+                        def handle_delete(item):
+                            item_id = item["id"]
+                            return _delete_collection(item_id)
+
+                        table = (
+                            ui.table(
+                                columns=columns, rows=rows, row_key="id", pagination=pagination
+                            )
+                            .classes("w-full")
+                            .on("rowClick", handle_view)
+                            .on(
+                                "update:pagination",
+                                create_sort_handler("/collections", None, sort_by, sort_desc),
+                            )
+                        )
+                        shown["table"] = table
+                        add_table_action_buttons(
+                            table,
+                            "actions",
+                            [
+                                {
+                                    "icon": "content_copy",
+                                    "color": "primary",
+                                    "tooltip": "Copy collection ID",
+                                    "client_js": "navigator.clipboard.writeText(props.row.id)",
+                                    "label_field": "name",
+                                },
+                                {
+                                    "icon": "file_copy",
+                                    "color": "primary",
+                                    "tooltip": "Copy collection name",
+                                    "client_js": "navigator.clipboard.writeText(props.row.name)",
+                                    "label_field": "name",
+                                },
+                                {
+                                    "icon": "delete",
+                                    "color": "negative",
+                                    "tooltip": "Delete collection",
+                                    "on_click": handle_delete,
+                                    "label_field": "name",
+                                    "confirm": True,
+                                    "confirm_message": "Deleting a collection will remove all documents within it. This action cannot be undone.",
+                                    "confirm_label": "Delete",
+                                },
+                            ],
                         )
-                    )
-                    add_table_action_buttons(
-                        table,
-                        "actions",
-                        [
-                            {
-                                "icon": "content_copy",
-                                "color": "primary",
-                                "tooltip": "Copy collection ID",
-                                "client_js": "navigator.clipboard.writeText(props.row.id)",
-                                "label_field": "name",
-                            },
-                            {
-                                "icon": "file_copy",
-                                "color": "primary",
-                                "tooltip": "Copy collection name",
-                                "client_js": "navigator.clipboard.writeText(props.row.name)",
-                                "label_field": "name",
-                            },
-                            {
-                                "icon": "delete",
-                                "color": "negative",
-                                "tooltip": "Delete collection",
-                                "on_click": handle_delete,
-                                "label_field": "name",
-                                "confirm": True,
-                                "confirm_message": "Deleting a collection will remove all documents within it. This action cannot be undone.",
-                                "confirm_label": "Delete",
-                            }
-                        ],
-                    )
+                else:
+                    ui.label("No collections yet. Create one above!")
             else:
-                ui.label("No collections yet. Create one above!")
-        else:
-            ui.notify(f"Error loading collections: {response.text}", type="negative")
+                ui.notify(f"Error loading collections: {response.text}", type="negative")
+
+        await collection_list()
 
-    render_page(content)
+    await render_page(content)
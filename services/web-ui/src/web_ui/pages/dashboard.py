@@ -1,12 +1,23 @@
-from datetime import datetime
+import asyncio
 
+import httpx
 from nicegui import APIRouter, ui
 
+from web_ui.api_client import get_client, parse_json
 from web_ui.auth import get_user, load_tokens_from_storage, require_auth
 from web_ui.components import render_page
 
 router = APIRouter(prefix="")
 
+# A slow summary should not hold back the rest of the dashboard.
+COUNT_TIMEOUT = 5.0
+
+
+def _json_or_empty(result) -> dict:
+    if result is None or result.status_code != 200:
+        return {}
+    return parse_json(result)
+
 
 @router.page("/dashboard")
 async def dashboard_page():
@@ -15,10 +26,8 @@ async def dashboard_page():
     if not require_auth():
         return
 
-    def content():
-        from web_ui.auth import get_api_client
-
-        api_client = get_api_client()
+    async def content():
+        api_client = get_client()
 
         user = get_user()
         if user:
@@ -26,43 +35,28 @@ async def dashboard_page():
         else:
             ui.label("Welcome!").classes("text-2xl font-bold")
 
+        try:
+            response = await asyncio.wait_for(api_client.get_summary(), COUNT_TIMEOUT)
+        except httpx.HTTPError, TimeoutError:
+            response = None
+
+        summary = _json_or_empty(response)
+
         with ui.row().classes("w-full gap-4 mt-4"):
-            response = api_client.list_collections()
-            collections = (
-                response.json().get("collections", []) if response.status_code == 200 else []
-            )
             with ui.card().classes("flex-1"):
                 ui.label("Collections").classes("text-lg font-bold")
-                ui.label(str(len(collections))).classes("text-4xl")
+                ui.label(str(summary.get("collections", 0))).classes("text-4xl")
 
-            response = api_client.list_documents()
-            docs_data = response.json() if response.status_code == 200 else {"total": 0}
             with ui.card().classes("flex-1"):
                 ui.label("Documents").classes("text-lg font-bold")
-                ui.label(str(docs_data.get("total", 0))).classes("text-4xl")
-
-            response = api_client.list_pats()
-            pats = response.json().get("tokens", []) if response.status_code == 200 else []
-
-            def is_token_active(expires_at):
-                if not expires_at:
-                    return True
-                try:
-                    expiry = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
-                    return expiry > datetime.now(expiry.tzinfo)
-                except ValueError, AttributeError:
-                    return True
+                ui.label(str(summary.get("documents", 0))).classes("text-4xl")
 
-            active_pats = [p for p in pats if is_token_active(p.get("expires_at"))]
             with ui.card().classes("flex-1"):
                 ui.label("PATs").classes("text-lg font-bold")
-                ui.label(str(len(active_pats))).classes("text-4xl")
+                ui.label(str(summary.get("pats", 0))).classes("text-4xl")
 
-            response = api_client.list_cats()
-            cats = response.json().get("tokens", []) if response.status_code == 200 else []
-            active_cats = [c for c in cats if is_token_active(c.get("expires_at"))]
             with ui.card().classes("flex-1"):
                 ui.label("CATs").classes("text-lg font-bold")
-                ui.label(str(len(active_cats))).classes("text-4xl")
+                ui.label(str(summary.get("cats", 0))).classes("text-4xl")
 
-    render_page(content)
+    await render_page(content)
@@ -1,177 +1,306 @@
+import asyncio
+
 from nicegui import APIRouter, ui
 from shared.config import settings
 
+from web_ui.api_client import get_client, parse_json
 from web_ui.auth import load_tokens_from_storage, require_auth
 from web_ui.components import (
     add_table_action_buttons,
+    build_sort_url,
+    cached_collection_options,
     create_sort_handler,
     create_table_pagination,
     make_columns_sortable,
     render_page,
+    store_collection_options,
 )
 from web_ui.utils import format_date, handle_api_error
 
 router = APIRouter(prefix="")
 
+# Seconds a filter selection must stand before the document list is fetched.
+FILTER_DEBOUNCE = 0.25
+
+
+def _complete_listing(result: dict) -> list[dict] | None:
+    if result["status_code"] != 200 or result["body"].get("offset", 0):
+        return None
+    documents = result["body"].get("documents", [])
+    return documents if result["body"].get("total", 0) <= len(documents) else None
+
+
+_DOCUMENT_COLUMNS = make_columns_sortable(
+    [
+        {"name": "title", "label": "Title", "field": "title", "align": "left"},
+        {
+            "name": "collection_name",
+            "label": "Collection",
+            "field": "collection_name",
+            "align": "left",
+        },
+        {
+            "name": "document_type",
+            "label": "Type",
+            "field": "document_type",
+            "align": "left",
+        },
+        {
+            "name": "created_at",
+            "label": "Created",
+            "field": "created_at",
+            "align": "left",
+        },
+        {
+            "name": "actions",
+            "label": "Actions",
+            "field": "actions",
+            "align": "center",
+        },
+    ]
+)
+
+
+def _row_from_document(d: dict) -> dict:
+    return {
+        "title": d["title"],
+        "collection_name": d.get("collection_name", ""),
+        "document_type": d["document_type"],
+        "created_at": format_date(d.get("created_at")),
+        "id": d["document_id"],
+    }
+
 
 @router.page("/documents")
 async def documents_page(
-    collection_id: str | None = None, sort_by: str = "", sort_desc: bool = False
+    collection_id: str | None = None, sort_by: str = "", sort_desc: bool = False, offset: int = 0
 ):
     await load_tokens_from_storage()
 
     if not require_auth():
         return
 
-    def content():
-        from web_ui.auth import get_api_client
-
-        api_client = get_api_client()
+    async def content():
+        api_client = get_client()
 
         ui.label("Documents").classes("text-2xl font-bold")
 
-        collection_response = api_client.list_collections()
-        collections = (
-            collection_response.json().get("collections", [])
-            if collection_response.status_code == 200
-            else []
-        )
-        collection_options = {"__all__": "All Collections"}
-        collection_options.update({c["collection_id"]: c["name"] for c in collections})
+        limit = settings.web_records_per_page
+        params = {"limit": limit, "offset": offset}
+        if collection_id and collection_id != "__all__":
+            params["collection_id"] = collection_id
 
+        # The filter renders before the data arrives; its options are filled in below.
         initial_value = collection_id if collection_id else "__all__"
-
+        cached_options = cached_collection_options()
+        if cached_options is not None and initial_value not in cached_options:
+            cached_options = None
         selected_collection = ui.select(
             label="Filter by Collection",
-            options=collection_options,
+            options=cached_options or {"__all__": "All Collections", initial_value: "Loading..."},
             value=initial_value,
         ).classes("w-full mb-4")
-        selected_collection.on_value_change(
-            lambda e: ui.navigate.to(f"/documents?collection_id={e.value}")
-        )
 
-        params = {}
-        if selected_collection.value and selected_collection.value != "__all__":
-            params["collection_id"] = selected_collection.value
-
-        response = api_client.list_documents(**params)
-        if response.status_code == 200:
-            docs_data = response.json()
-            documents = docs_data.get("documents", [])
-            if documents:
-                with ui.card().classes("w-full"):
-                    columns = make_columns_sortable(
-                        [
-                            {"name": "title", "label": "Title", "field": "title", "align": "left"},
-                            {
-                                "name": "collection_name",
-                                "label": "Collection",
-                                "field": "collection_name",
-                                "align": "left",
-                            },
-                            {
-                                "name": "document_type",
-                                "label": "Type",
-                                "field": "document_type",
-                                "align": "left",
-                            },
-                            {
-                                "name": "created_at",
-                                "label": "Created",
-                                "field": "created_at",
-                                "align": "left",
-                            },
-                            {
-                                "name": "actions",
-                                "label": "Actions",
-                                "field": "actions",
-                                "align": "center",
-                            },
-                        ]
-                    )
-
-                    pagination = create_table_pagination(
-                        sort_by, sort_desc, settings.web_records_per_page
-                    )
-
-                    rows = []
-                    for d in documents:
-                        rows.append(
-                            {
-                                "title": d["title"],
-                                "collection_name": d.get("collection_name", ""),
-                                "document_type": d["document_type"],
-                                "created_at": format_date(d.get("created_at")),
-                                "id": d["document_id"],
-                                "content": d.get("content", ""),
-                            }
+        # Documents, plus collections unless the session has them, in one round trip.
+        calls = [{"method": "GET", "path": "/api/v1/documents", "params": params}]
+        if cached_options is None:
+            calls.insert(0, {"method": "GET", "path": "/api/v1/collections"})
+        batch_response = await api_client.batch(calls)
+        if batch_response.status_code == 200:
+            results = parse_json(batch_response)["results"]
+        else:
+            results = [
+                {"status_code": batch_response.status_code, "body": batch_response.text}
+            ] * len(calls)
+        documents_result = results[-1]
+
+        if cached_options is None:
+            collection_result = results[0]
+            if collection_result["status_code"] == 200:
+                collection_options = store_collection_options(
+                    collection_result["body"].get("collections", [])
+                )
+            else:
+                collection_options = {"__all__": "All Collections"}
+            selected_collection.set_options(collection_options, value=initial_value)
+
+        # Deleting a document re-fetches and re-renders only this list, not the page.
+        @ui.refreshable
+        def document_list(documents_result):
+            if documents_result["status_code"] == 200:
+                docs_data = documents_result["body"]
+                documents = docs_data.get("documents", [])
+                if documents:
+                    with ui.card().classes("w-full"):
+                        columns = _DOCUMENT_COLUMNS
+
+                        pagination = create_table_pagination(
+                            sort_by, sort_desc, settings.web_records_per_page
                         )
 
-                    def handle_view(e):
-                        row = e.args[1]
-                        doc_id = row["id"]
-                        if collection_id and collection_id != "__all__":
-                            ui.navigate.to(f"/viewer/{doc_id}?collection_id={collection_id}")
-                        else:
-                            ui.navigate.to(f"/viewer/{doc_id}")
-
-                    async def _delete_document(item_id: str):
-                        response = api_client.delete_document(item_id)
-                        if handle_api_error(response, "Failed to delete document"):
-                            ui.notify("Document deleted")
-                            ui.navigate.reload()
-
-                    def handle_delete(item):
-                        item_id = item["id"]
-                        return _delete_document(item_id)
-
-                    table = (
-                        ui.table(columns=columns, rows=rows, row_key="id", pagination=pagination)
-                        .classes("w-full")
-                        .on("rowClick", handle_view)
-                        .on(
-                            "update:pagination",
-                            create_sort_handler(
-                                "/documents",
-                                lambda: {"collection_id": selected_collection.value},
-                                sort_by,
-                                sort_desc,
-                            ),
+                        rows = [_row_from_document(d) for d in documents]
+
+                        def handle_view(e):
+                            row = e.args[1]
+                            doc_id = row["id"]
+                            selected = selected_collection.value
+                            if selected and selected != "__all__":
+                                ui.navigate.to(f"/viewer/{doc_id}?collection_id={selected}")
+                            else:
+                                ui.navigate.to(f"/viewer/{doc_id}")
+
+                        async def _delete_document(item_id: str):
+                            response = await api_client.delete_document(item_id)
+                            if handle_api_error(response, "Failed to delete document"):
+                                ui.notify("Document deleted")
+                                # Drop the row locally; re-fetch only for the empty state.
+                                table.remove_rows([{"id": item_id}])
+                                if all_documents is not None:
+                                    all_documents[:] = [
+                                        d for d in all_documents if d["document_id"] != item_id
+                                    ]
+                                if not table.rows:
+                                    await reload_documents()
+
+                        def handle_delete(item):
+                            item_id = item["id"]
+                            return _delete_document(item_id)
+
+                        table = (
+                            ui.table(
+                                columns=columns, rows=rows, row_key="id", pagination=pagination
+                            )
+                            .classes("w-full")
+                            .on("rowClick", handle_view)
+                            .on(
+                                "update:pagination",
+                                create_sort_handler(
+                                    "/documents",
+                                    lambda: {
+                                        "collection_id": selected_collection.value,
+                                        "offset": params["offset"],
+                                    },
+                                    sort_by,
+                                    sort_desc,
+                                ),
+                            )
                         )
-                    )
-                    add_table_action_buttons(
-                        table,
-                        "actions",
-                        [
-                            {
-                                "icon": "content_copy",
-                                "color": "primary",
-                                "tooltip": "Copy document ID",
-                                "client_js": "navigator.clipboard.writeText(props.row.id)",
-                                "label_field": "title",
-                            },
-                            {
-                                "icon": "file_copy",
-                                "color": "primary",
-                                "tooltip": "Copy document title",
-                                "client_js": "navigator.clipboard.writeText(props.row.title)",
-                                "label_field": "title",
-                            },
-                            {
-                                "icon": "delete",
-                                "color": "negative",
-                                "tooltip": "Delete document",
-                                "on_click": handle_delete,
-                                "label_field": "title",
-                                "confirm": True,
-                                "confirm_message": "Deleting a document removes it permanently. This action cannot be undone.",
-                                "confirm_label": "Delete",
-                            }
-                        ],
-                    )
+                        add_table_action_buttons(
+                            table,
+                            "actions",
+                            [
+                                {
+                                    "icon": "content_copy",
+                                    "color": "primary",
+                                    "tooltip": "Copy document ID",
+                                    "client_js": "navigator.clipboard.writeText(props.row.id)",
+                                    "label_field": "title",
+                                },
+                                {
+                                    "icon": "file_copy",
+                                    "color": "primary",
+                                    "tooltip": "Copy document title",
+                                    "client_js": "navigator.clipboard.writeText(props.row.title)",
+                                    "label_field": "title",
+                                },
+                                {
+                                    "icon": "delete",
+                                    "color": "negative",
+                                    "tooltip": "Delete document",
+                                    "on_click": handle_delete,
+                                    "label_field": "title",
+                                    "confirm": True,
+                                    "confirm_message": "Deleting a document removes it permanently. This action cannot be undone.",
+                                    "confirm_label": "Delete",
+                                },
+                            ],
+                        )
+
+                    # Only one page is fetched at a time; step through the rest here.
+                    total = docs_data.get("total", len(documents))
+                    if total > limit:
+                        page_offset = params["offset"]
+                        with ui.row().classes("w-full justify-center items-center gap-2 mt-4"):
+                            if page_offset > 0:
+                                ui.button(
+                                    "Previous",
+                                    on_click=lambda: show_page(max(0, page_offset - limit)),
+                                ).props("flat")
+                            ui.label(
+                                f"Page {page_offset // limit + 1} of {(total + limit - 1) // limit}"
+                            )
+                            if page_offset + limit < total:
+                                ui.button(
+                                    "Next", on_click=lambda: show_page(page_offset + limit)
+                                ).props("flat")
+                else:
+                    ui.label("No documents yet.")
             else:
-                ui.label("No documents yet.")
-        else:
-            ui.notify(f"Error loading documents: {response.text}", type="negative")
+                ui.notify(f"Error loading documents: {documents_result['body']}", type="negative")
+
+        # An unfiltered listing that holds every document lets the filter run in memory.
+        all_documents = (
+            _complete_listing(documents_result) if "collection_id" not in params else None
+        )
+
+        async def reload_documents():
+            nonlocal all_documents
+            response = await api_client.list_documents(**params)
+            body = parse_json(response) if response.status_code == 200 else response.text
+            result = {"status_code": response.status_code, "body": body}
+            if result["status_code"] == 200 and not body.get("documents") and params["offset"]:
+                # Deletes emptied this page; fall back to the one before it.
+                await show_page(max(0, params["offset"] - limit))
+                return
+            all_documents = _complete_listing(result) if "collection_id" not in params else None
+            document_list.refresh(result)
+
+        def sync_url():
+            ui.navigate.history.replace(
+                build_sort_url(
+                    "/documents",
+                    sort_by,
+                    sort_desc,
+                    {
+                        "collection_id": selected_collection.value,
+                        "offset": params["offset"] or None,
+                    },
+                )
+            )
+
+        async def show_page(page_offset: int):
+            params["offset"] = page_offset
+            sync_url()
+            await reload_documents()
+
+        filter_changes = 0
+
+        async def apply_filter(e):
+            # Only the last of a quick run of selections fetches; the list is redrawn
+            # in place and the URL updated, rather than navigating to a new page.
+            nonlocal filter_changes
+            filter_changes += 1
+            change = filter_changes
+            await asyncio.sleep(FILTER_DEBOUNCE)
+            if change != filter_changes:
+                return
+            if e.value and e.value != "__all__":
+                params["collection_id"] = e.value
+            else:
+                params.pop("collection_id", None)
+            params["offset"] = 0
+            sync_url()
+            if all_documents is None:
+                await reload_documents()
+                return
+            documents = [
+                d
+                for d in all_documents
+                if "collection_id" not in params or d["collection_id"] == e.value
+            ]
+            document_list.refresh({"status_code": 200, "body": {"documents": documents}})
+
+        selected_collection.on_value_change(apply_filter)
+        document_list(documents_result)
 
-    render_page(content)
+    await render_page(content)
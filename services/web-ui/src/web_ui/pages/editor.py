@@ -1,6 +1,7 @@
 from nicegui import APIRouter, ui
 from shared.constants import DocumentType
 
+from web_ui.api_client import get_client, parse_json
 from web_ui.auth import load_tokens_from_storage, require_auth
 from web_ui.components import render_page
 from web_ui.utils import handle_api_error
@@ -17,17 +18,15 @@ async def editor_page(doc_id: str):
     if not require_auth():
         return
 
-    def content():
-        from web_ui.auth import get_api_client
+    async def content():
+        api_client = get_client()
 
-        api_client = get_api_client()
-
-        response = api_client.get_document(doc_id)
+        response = await api_client.get_document(doc_id)
         if not handle_api_error(response, "Failed to load document"):
             ui.navigate.to("/documents")
             return
 
-        doc = response.json()
+        doc = parse_json(response)
 
         current_doc = {
             "title": doc["title"],
@@ -92,7 +91,7 @@ async def editor_page(doc_id: str):
         with ui.row().classes("w-full justify-end gap-2 mt-4"):
 
             async def save():
-                resp = api_client.update_document(
+                resp = await api_client.update_document(
                     doc_id,
                     title=current_doc["title"],
                     document_type=current_doc["document_type"],
@@ -107,4 +106,4 @@ async def editor_page(doc_id: str):
                 on_click=lambda: ui.navigate.to(f"/viewer/{doc_id}"),
             ).props("flat")
 
-    render_page(content)
+    await render_page(content)
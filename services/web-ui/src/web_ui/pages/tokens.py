@@ -1,33 +1,67 @@
-from datetime import datetime
+import asyncio
 
 from nicegui import APIRouter, ui
 from shared.config import settings
 
+from web_ui.api_client import get_client, parse_json
 from web_ui.auth import load_tokens_from_storage, require_auth
 from web_ui.components import (
     add_table_action_buttons,
+    build_sort_url,
     create_sort_handler,
     create_table_pagination,
+    get_collection_options,
     make_columns_sortable,
     render_page,
 )
 from web_ui.components.common import mcp_token_dialog
-from web_ui.utils import format_time_remaining, handle_api_error
+from web_ui.utils import format_time_remaining, handle_api_error, is_token_active
 
 router = APIRouter(prefix="")
 
+_PAT_COLUMNS = make_columns_sortable(
+    [
+        {"name": "label", "label": "Label", "field": "label", "align": "left"},
+        {"name": "scopes", "label": "Scopes", "field": "scopes", "align": "left"},
+        {"name": "expires_at", "label": "Expires", "field": "expires_at", "align": "left"},
+        {"name": "actions", "label": "Actions", "field": "actions", "align": "center"},
+    ]
+)
+
+_CAT_COLUMNS = make_columns_sortable(
+    [
+        {"name": "label", "label": "Label", "field": "label", "align": "left"},
+        {
+            "name": "collection_name",
+            "label": "Collection",
+            "field": "collection_name",
+            "align": "left",
+        },
+        {"name": "permission", "label": "Permission", "field": "permission", "align": "left"},
+        {"name": "expires_at", "label": "Expires", "field": "expires_at", "align": "left"},
+        {"name": "actions", "label": "Actions", "field": "actions", "align": "center"},
+    ]
+)
+
+# Greys out the label of expired tokens; shared by the PAT and CAT tables.
+_TOKEN_LABEL_SLOT = """<q-td :props="props">
+    <div :class="props.row.is_active ? '' : 'text-grey text-italic'">
+        {{ props.value }}
+    </div>
+</q-td>"""
+
 
 @router.page("/tokens")
-async def tokens_page(tab: str = "pat", sort_by: str = "", sort_desc: bool = False):
+async def tokens_page(
+    tab: str = "pat", sort_by: str = "", sort_desc: bool = False, offset: int = 0
+):
     await load_tokens_from_storage()
 
     if not require_auth():
         return
 
-    def content():
-        from web_ui.auth import get_api_client
-
-        api_client = get_api_client()
+    async def content():
+        api_client = get_client()
 
         with ui.tabs().classes("w-full") as tabs:
             pat_tab = ui.tab("Personal Access Tokens")
@@ -36,15 +70,39 @@ async def tokens_page(tab: str = "pat", sort_by: str = "", sort_desc: bool = Fal
         default_tab = cat_tab if tab == "cat" else pat_tab
 
         with ui.tab_panels(tabs, value=default_tab).classes("w-full"):
-            with ui.tab_panel(pat_tab):
-                _render_pat_panel(api_client, sort_by, sort_desc)
-            with ui.tab_panel(cat_tab):
-                _render_cat_panel(api_client, sort_by, sort_desc)
-
-    render_page(content)
+            pat_panel = ui.tab_panel(pat_tab)
+            cat_panel = ui.tab_panel(cat_tab)
 
+        # A panel's data is fetched the first time its tab is shown, so a visit that
+        # stays on one tab never loads the other.
+        rendered = set()
 
-def _render_pat_panel(api_client, sort_by: str = "", sort_desc: bool = False):
+        async def show_panel(value):
+            name = value.props["name"] if isinstance(value, ui.tab) else value
+            if name in rendered:
+                return
+            rendered.add(name)
+            if name == cat_tab.props["name"]:
+                collection_options, cats_response = await asyncio.gather(
+                    get_collection_options(api_client),
+                    api_client.list_cats(limit=settings.web_records_per_page, offset=offset),
+                )
+                with cat_panel:
+                    _render_cat_panel(
+                        api_client, collection_options, cats_response, sort_by, sort_desc, offset
+                    )
+            else:
+                pats_response = await api_client.list_pats()
+                with pat_panel:
+                    _render_pat_panel(api_client, pats_response, sort_by, sort_desc)
+
+        tabs.on_value_change(lambda e: show_panel(e.value))
+        await show_panel(default_tab)
+
+    await render_page(content)
+
+
+def _render_pat_panel(api_client, response, sort_by: str = "", sort_desc: bool = False):
     ui.label("Personal Access Tokens").classes("text-xl font-bold mb-4")
 
     pat_label = ui.input("Token Label").classes("w-full")
@@ -58,11 +116,16 @@ def _render_pat_panel(api_client, sort_by: str = "", sort_desc: bool = False):
             except ValueError:
                 ui.notify("Invalid expires value", type="negative")
                 return
-        response = api_client.create_pat(pat_label.value, expires_days)
+        response = await api_client.create_pat(pat_label.value, expires_days)
         if response.status_code == 201:
-            data = response.json()
+            data = parse_json(response)
             token = data.get("token", "N/A")
-            await mcp_token_dialog(token, "Token Created")
+            # The new token comes back whole; only the empty state needs a re-render.
+            table = shown.get("table")
+            if table is not None:
+                table.add_row(_row_from_pat(data))
+            on_close = reload_pats if table is None else None
+            await mcp_token_dialog(token, "Token Created", on_close=on_close)
             pat_label.set_value("")
             pat_expires.set_value("")
         else:
@@ -70,65 +133,65 @@ def _render_pat_panel(api_client, sort_by: str = "", sort_desc: bool = False):
 
     ui.button("Create PAT", on_click=create_pat).props("color=primary")
 
-    response = api_client.list_pats()
-    if response.status_code == 200:
-        pats = response.json().get("tokens", [])
-        if pats:
-            _render_pat_table(api_client, pats, sort_by, sort_desc)
+    shown = {}
+
+    @ui.refreshable
+    def pat_list(response):
+        shown.pop("table", None)
+        if response.status_code == 200:
+            pats = parse_json(response).get("tokens", [])
+            if pats:
+                shown["table"] = _render_pat_table(
+                    api_client, pats, reload_pats, sort_by, sort_desc
+                )
+            else:
+                ui.label("No PATs yet.")
         else:
-            ui.label("No PATs yet.")
-    else:
-        ui.notify(f"Error loading PATs: {response.text}", type="negative")
+            ui.notify(f"Error loading PATs: {response.text}", type="negative")
 
+    async def reload_pats():
+        pat_list.refresh(await api_client.list_pats())
 
-def _render_pat_table(api_client, pats, sort_by: str = "", sort_desc: bool = False):
+    pat_list(response)
+
+
+def _replace_row(table, row_id: str, row: dict):
+    table.update_rows([row if r["id"] == row_id else r for r in table.rows])
+
+
+# format_time_remaining renders a missing expiry as "Never".
+def _row_from_pat(p: dict) -> dict:
+    expires_at = p.get("expires_at")
+    return {
+        "label": p["label"],
+        "scopes": ", ".join(p.get("scopes", [])),
+        "is_active": is_token_active(expires_at),
+        "expires_at": format_time_remaining(expires_at),
+        "id": p["pat_id"],
+    }
+
+
+def _render_pat_table(api_client, pats, on_change, sort_by: str = "", sort_desc: bool = False):
     if not sort_by:
         sort_by = "expires_at"
         sort_desc = True
-    columns = make_columns_sortable(
-        [
-            {"name": "label", "label": "Label", "field": "label", "align": "left"},
-            {"name": "scopes", "label": "Scopes", "field": "scopes", "align": "left"},
-            {"name": "expires_at", "label": "Expires", "field": "expires_at", "align": "left"},
-            {"name": "actions", "label": "Actions", "field": "actions", "align": "center"},
-        ]
-    )
+    columns = _PAT_COLUMNS
 
     pagination = create_table_pagination(sort_by, sort_desc, settings.web_records_per_page)
 
-    def is_token_active(expires_at):
-        if not expires_at:
-            return True
-        try:
-            expiry = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
-            return expiry > datetime.now(expiry.tzinfo)
-        except ValueError, AttributeError:
-            return True
-
-    rows = []
-    for p in pats:
-        expires = p.get("expires_at")
-        if expires:
-            expires = format_time_remaining(expires)
-        is_active = is_token_active(p.get("expires_at"))
-        rows.append(
-            {
-                "label": p["label"],
-                "scopes": ", ".join(p.get("scopes", [])),
-                "is_active": is_active,
-                "expires_at": expires or "Never",
-                "id": p["pat_id"],
-            }
-        )
+    rows = [_row_from_pat(p) for p in pats]
 
     async def _rotate_pat(
         item_id: str, label: str | None = None, expires_in_days: int | None = None
     ):
-        response = api_client.rotate_pat(item_id, label=label, expires_in_days=expires_in_days)
+        response = await api_client.rotate_pat(
+            item_id, label=label, expires_in_days=expires_in_days
+        )
         if response.status_code == 200:
-            data = response.json()
-            token = data.get("token", "N/A")
-            await mcp_token_dialog(token, "Token Rotated")
+            data = parse_json(response)
+            # The rotated token comes back whole; swap its row in place.
+            _replace_row(table, item_id, _row_from_pat(data))
+            await mcp_token_dialog(data.get("token", "N/A"), "Token Rotated")
         else:
             ui.notify(f"Error: {response.text}", type="negative")
 
@@ -165,10 +228,13 @@ def _render_pat_table(api_client, pats, sort_by: str = "", sort_desc: bool = Fal
         dialog.open()
 
     async def _delete_pat(item_id: str):
-        response = api_client.delete_pat(item_id)
+        response = await api_client.delete_pat(item_id)
         if handle_api_error(response, "Failed to delete PAT"):
             ui.notify("PAT deleted")
-            ui.navigate.reload()
+            # Drop the row locally; only refetch when the empty state has to be shown.
+            table.remove_rows([{"id": item_id}])
+            if not table.rows:
+                await on_change()
 
     def rotate_pat(item):
         return _show_rotate_pat_dialog(item)
@@ -185,14 +251,7 @@ def _render_pat_table(api_client, pats, sort_by: str = "", sort_desc: bool = Fal
         create_sort_handler("/tokens", lambda: {"tab": "pat"}, sort_by, sort_desc),
     )
 
-    table.add_slot(
-        "body-cell-label",
-        """<q-td :props="props">
-            <div :class="props.row.is_active ? '' : 'text-grey text-italic'">
-                {{ props.value }}
-            </div>
-        </q-td>""",
-    )
+    table.add_slot("body-cell-label", _TOKEN_LABEL_SLOT)
 
     add_table_action_buttons(
         table,
@@ -216,15 +275,21 @@ def _render_pat_table(api_client, pats, sort_by: str = "", sort_desc: bool = Fal
             },
         ],
     )
-
-
-def _render_cat_panel(api_client, sort_by: str = "", sort_desc: bool = False):
+    return table
+
+
+def _render_cat_panel(
+    api_client,
+    collection_options,
+    response,
+    sort_by: str = "",
+    sort_desc: bool = False,
+    offset: int = 0,
+):
+    limit = settings.web_records_per_page
     ui.label("Collection Access Tokens").classes("text-xl font-bold mb-4")
 
     cat_label = ui.input("Token Label").classes("w-full")
-    collection_list = api_client.list_collections().json().get("collections", [])
-    collection_options = {"__all__": "All Collections"}
-    collection_options.update({c["collection_id"]: c["name"] for c in collection_list})
     cat_collection = ui.select(
         label="Collection",
         options=collection_options,
@@ -255,16 +320,21 @@ def _render_cat_panel(api_client, sort_by: str = "", sort_desc: bool = False):
         if collection_id == "__all__":
             collection_id = None
         permission_id = _val(cat_permission.value) or "read"
-        response = api_client.create_cat(
+        response = await api_client.create_cat(
             cat_label.value,
             collection_id,
             permission_id,
             expires_days,
         )
         if response.status_code == 201:
-            data = response.json()
+            data = parse_json(response)
             token = data.get("token", "N/A")
-            await mcp_token_dialog(token, "Token Created")
+            # New tokens sort first on the server, so they belong on the first page.
+            table = shown.get("table") if offset == 0 else None
+            if table is not None:
+                table.add_row(_row_from_cat(data))
+            on_close = reload_cats if table is None else None
+            await mcp_token_dialog(token, "Token Created", on_close=on_close)
             cat_label.set_value("")
             cat_expires.set_value("")
         else:
@@ -272,72 +342,86 @@ def _render_cat_panel(api_client, sort_by: str = "", sort_desc: bool = False):
 
     ui.button("Create CAT", on_click=create_cat).props("color=primary")
 
-    response = api_client.list_cats()
-    if response.status_code == 200:
-        cats = response.json().get("tokens", [])
-        if cats:
-            _render_cat_table(api_client, cats, sort_by, sort_desc)
-        else:
-            ui.label("No CATs yet.")
-    else:
-        ui.notify(f"Error loading CATs: {response.text}", type="negative")
-
+    def page_url(page_offset: int) -> str:
+        return build_sort_url("/tokens", sort_by, sort_desc, {"tab": "cat", "offset": page_offset})
+
+    # The API returns one page at a time, so only the visible rows are ever built.
+    shown = {}
+
+    @ui.refreshable
+    def cat_list(response):
+        shown.pop("table", None)
+        if response.status_code != 200:
+            ui.notify(f"Error loading CATs: {response.text}", type="negative")
+            return
+        data = parse_json(response)
+        cats = data.get("tokens", [])
+        total = data.get("total", len(cats))
+        if not cats:
+            if offset > 0:
+                # The last token on this page went away; show the previous page.
+                ui.navigate.to(page_url(max(0, offset - limit)))
+            else:
+                ui.label("No CATs yet.")
+            return
+        shown["table"] = _render_cat_table(
+            api_client, cats, reload_cats, sort_by, sort_desc, offset
+        )
 
-def _render_cat_table(api_client, cats, sort_by: str = "", sort_desc: bool = False):
+        if total > limit:
+            with ui.row().classes("w-full justify-center items-center gap-2 mt-4"):
+                if offset > 0:
+                    ui.button(
+                        "Previous",
+                        on_click=lambda: ui.navigate.to(page_url(max(0, offset - limit))),
+                    ).props("flat")
+                ui.label(f"Page {offset // limit + 1} of {(total + limit - 1) // limit}")
+                if offset + limit < total:
+                    ui.button(
+                        "Next", on_click=lambda: ui.navigate.to(page_url(offset + limit))
+                    ).props("flat")
+
+    async def reload_cats():
+        cat_list.refresh(await api_client.list_cats(limit=limit, offset=offset))
+
+    cat_list(response)
+
+
+def _row_from_cat(c: dict) -> dict:
+    expires_at = c.get("expires_at")
+    return {
+        "label": c["label"],
+        "collection_name": c.get("collection_name", "N/A"),
+        "permission": c.get("permission", "read"),
+        "is_active": is_token_active(expires_at),
+        "expires_at": format_time_remaining(expires_at),
+        "id": c["cat_id"],
+    }
+
+
+def _render_cat_table(
+    api_client, cats, on_change, sort_by: str = "", sort_desc: bool = False, offset: int = 0
+):
     if not sort_by:
         sort_by = "expires_at"
         sort_desc = True
-    columns = make_columns_sortable(
-        [
-            {"name": "label", "label": "Label", "field": "label", "align": "left"},
-            {
-                "name": "collection_name",
-                "label": "Collection",
-                "field": "collection_name",
-                "align": "left",
-            },
-            {"name": "permission", "label": "Permission", "field": "permission", "align": "left"},
-            {"name": "expires_at", "label": "Expires", "field": "expires_at", "align": "left"},
-            {"name": "actions", "label": "Actions", "field": "actions", "align": "center"},
-        ]
-    )
+    columns = _CAT_COLUMNS
 
     pagination = create_table_pagination(sort_by, sort_desc, settings.web_records_per_page)
 
-    def is_token_active(expires_at):
-        if not expires_at:
-            return True
-        try:
-            expiry = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
-            return expiry > datetime.now(expiry.tzinfo)
-        except ValueError, AttributeError:
-            return True
-
-    rows = []
-    for c in cats:
-        expires = c.get("expires_at")
-        if expires:
-            expires = format_time_remaining(expires)
-        is_active = is_token_active(c.get("expires_at"))
-        rows.append(
-            {
-                "label": c["label"],
-                "collection_name": c.get("collection_name", "N/A"),
-                "permission": c.get("permission", "read"),
-                "is_active": is_active,
-                "expires_at": expires or "Never",
-                "id": c["cat_id"],
-            }
-        )
+    rows = [_row_from_cat(c) for c in cats]
 
     async def _rotate_cat(
         item_id: str, label: str | None = None, expires_in_days: int | None = None
     ):
-        response = api_client.rotate_cat(item_id, label=label, expires_in_days=expires_in_days)
+        response = await api_client.rotate_cat(
+            item_id, label=label, expires_in_days=expires_in_days
+        )
         if response.status_code == 200:
-            data = response.json()
-            token = data.get("token", "N/A")
-            await mcp_token_dialog(token, "Token Rotated")
+            data = parse_json(response)
+            # The rotated token comes back whole; swap its row in place.
+            _replace_row(table, item_id, _row_from_cat(data))
+            await mcp_token_dialog(data.get("token", "N/A"), "Token Rotated")
         else:
             ui.notify(f"Error: {response.text}", type="negative")
 
@@ -374,10 +458,13 @@ def _render_cat_table(api_client, cats, sort_by: str = "", sort_desc: bool = Fal
         dialog.open()
 
     async def _delete_cat(item_id: str):
-        response = api_client.delete_cat(item_id)
+        response = await api_client.delete_cat(item_id)
         if handle_api_error(response, "Failed to delete CAT"):
             ui.notify("CAT deleted")
-            ui.navigate.to("/tokens?tab=cat")
+            # Drop the row locally; only refetch when the empty state has to be shown.
+            table.remove_rows([{"id": item_id}])
+            if not table.rows:
+                await on_change()
 
     def rotate_cat(item):
         return _show_rotate_cat_dialog(item)
@@ -391,17 +478,12 @@ def _render_cat_table(api_client, cats, sort_by: str = "", sort_desc: bool = Fal
     )
     table.on(
         "update:pagination",
-        create_sort_handler("/tokens", lambda: {"tab": "cat"}, sort_by, sort_desc),
+        create_sort_handler(
+            "/tokens", lambda: {"tab": "cat", "offset": offset}, sort_by, sort_desc
+        ),
     )
 
-    table.add_slot(
-        "body-cell-label",
-        """<q-td :props="props">
-            <div :class="props.row.is_active ? '' : 'text-grey text-italic'">
-                {{ props.value }}
-            </div>
-        </q-td>""",
-    )
+    table.add_slot("body-cell-label", _TOKEN_LABEL_SLOT)
 
     add_table_action_buttons(
         table,
@@ -425,3 +507,4 @@ def _render_cat_table(api_client, cats, sort_by: str = "", sort_desc: bool = Fal
             },
         ],
     )
+    return table
@@ -2,6 +2,7 @@ import json
 
 from nicegui import APIRouter, ui
 
+from web_ui.api_client import get_client, parse_json
 from web_ui.auth import load_tokens_from_storage, require_auth
 from web_ui.components import render_page
 from web_ui.utils import handle_api_error
@@ -16,17 +17,15 @@ async def viewer_page(doc_id: str, collection_id: str | None = None):
     if not require_auth():
         return
 
-    def content():
-        from web_ui.auth import get_api_client
+    async def content():
+        api_client = get_client()
 
-        api_client = get_api_client()
-
-        response = api_client.get_document(doc_id)
+        response = await api_client.get_document(doc_id)
         if not handle_api_error(response, "Failed to load document"):
             ui.navigate.to("/documents")
             return
 
-        doc = response.json()
+        doc = parse_json(response)
 
         with ui.row().classes("w-full items-center justify-between mb-4"):
             with ui.row().classes("items-center gap-2"):
@@ -68,4 +67,4 @@ async def viewer_page(doc_id: str, collection_id: str | None = None):
         else:
             ui.pre(content).classes("whitespace-pre-wrap w-full font-mono text-sm")
 
-    render_page(content)
+    await render_page(content)
@@ -1,17 +1,39 @@
+import json
 from datetime import UTC, datetime
+from functools import lru_cache
 
 
+# Table rows repeat the same timestamps on every render; parse each string once.
+@lru_cache(maxsize=4096)
+def parse_iso(iso_str: str) -> datetime:
+    return datetime.fromisoformat(iso_str)
+
+
+@lru_cache(maxsize=4096)
 def format_date(iso_str: str | None) -> str:
     if not iso_str:
         return ""
-    return datetime.fromisoformat(iso_str.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M:%S")
+    # Extended ISO timestamps already start with the wanted "YYYY-MM-DD HH:MM:SS".
+    if len(iso_str) >= 19 and iso_str[4] == "-" and iso_str[10] in "T " and iso_str[16] == ":":
+        return f"{iso_str[:10]} {iso_str[11:19]}"
+    return parse_iso(iso_str).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def is_token_active(expires_at: str | None) -> bool:
+    if not expires_at:
+        return True
+    try:
+        expiry = parse_iso(expires_at)
+        return expiry > datetime.now(expiry.tzinfo)
+    except ValueError, AttributeError:
+        return True
 
 
 def format_time_remaining(iso_str: str | None) -> str:
     if not iso_str:
         return "Never"
     try:
-        expires_at = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
+        expires_at = parse_iso(iso_str)
         now = datetime.now(UTC)
         if expires_at.tzinfo is None:
             expires_at = expires_at.replace(tzinfo=UTC)
@@ -43,3 +65,9 @@ def handle_api_error(response, default_msg: str = "An error occurred") -> bool:
         return True
     ui.notify(f"Error: {response.text}", type="negative")
     return False
+
+
+def js_string(value: str) -> str:
+    # A JSON string is a valid, fully escaped JS string literal, so values can be
+    # spliced into run_javascript code without breaking out of the quotes.
+    return json.dumps(value)
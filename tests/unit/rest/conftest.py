@@ -0,0 +1,36 @@
+"""Shared fixtures for REST API unit tests."""
+
+import pytest
+from fastapi.testclient import TestClient
+from rest_api.app import create_app
+from rest_api.deps import CurrentUser, get_current_user
+from shared.db.models import Scope
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+@pytest.fixture
+def client(app):
+    return TestClient(app)
+
+
+@pytest.fixture
+def regular_user():
+    return CurrentUser(
+        user_id="user-123",
+        username="testuser",
+        email="test@example.com",
+        is_superuser=False,
+        scopes=[Scope.READ, Scope.WRITE],
+    )
+
+
+@pytest.fixture
+def as_regular_user(app, regular_user):
+    """Authenticate every request to ``app`` as ``regular_user``."""
+    app.dependency_overrides[get_current_user] = lambda: regular_user
+    yield regular_user
+    app.dependency_overrides.clear()
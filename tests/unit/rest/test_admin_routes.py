@@ -175,8 +175,7 @@ class TestPromoteUser:
 
         with patch("rest_api.routes.admin.get_user_repository") as mock_repo:
             mock_repository = AsyncMock()
-            mock_repository.get_by_id = AsyncMock(return_value=mock_user)
-            mock_repository.update = AsyncMock(return_value=True)
+            mock_repository.promote = AsyncMock(return_value=mock_user)
             mock_repo.return_value = mock_repository
 
             with patch("rest_api.deps.settings") as mock_settings:
@@ -191,6 +190,40 @@ class TestPromoteUser:
         data = response.json()
         assert data["username"] == "testuser"
         assert data["is_superuser"] is True
+        mock_repository.get_by_id.assert_not_called()
+
+    def test_promote_user_already_superuser(self, app, client):
+        """Test promoting an existing superuser returns the unchanged user."""
+        mock_user = type(
+            "User",
+            (),
+            {
+                "user_id": "user-123",
+                "email": "test@example.com",
+                "username": "testuser",
+                "is_active": True,
+                "is_superuser": True,
+                "created_at": "2024-01-01T00:00:00",
+            },
+        )()
+
+        with patch("rest_api.routes.admin.get_user_repository") as mock_repo:
+            mock_repository = AsyncMock()
+            mock_repository.promote = AsyncMock(return_value=None)
+            mock_repository.get_by_id = AsyncMock(return_value=mock_user)
+            mock_repo.return_value = mock_repository
+
+            with patch("rest_api.deps.settings") as mock_settings:
+                mock_settings.admin_api_key = "test-admin-key"
+
+                response = client.post(
+                    "/api/v1/admin/users/user-123/promote",
+                    headers={"X-Admin-API-Key": "test-admin-key"},
+                )
+
+        assert response.status_code == 200
+        assert response.json()["is_superuser"] is True
+        mock_repository.update.assert_not_called()
 
     def test_promote_user_invalid_api_key(self, app, client):
         """Test invalid admin API key returns 401."""
@@ -218,6 +251,7 @@ class TestPromoteUser:
         """Test non-existent user returns 404."""
         with patch("rest_api.routes.admin.get_user_repository") as mock_repo:
             mock_repository = AsyncMock()
+            mock_repository.promote = AsyncMock(return_value=None)
             mock_repository.get_by_id = AsyncMock(return_value=None)
             mock_repo.return_value = mock_repository
 
@@ -43,6 +43,54 @@ class TestRestApi:
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
 
+    def test_large_responses_are_gzipped(self):
+        """Test that responses above the size threshold are compressed on request."""
+        from fastapi.testclient import TestClient
+        from rest_api.app import create_app
+
+        client = TestClient(create_app())
+
+        response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.json()["info"]["title"] == "ainstruct API"
+        assert "Content-Encoding" not in small.headers
+
+    def test_response_model_instances_pass_through(self):
+        """Test that returning the declared response model skips revalidation."""
+        from datetime import datetime
+
+        from fastapi.routing import APIRoute
+        from rest_api.app import create_app
+        from rest_api.schemas import UserListItem, UserListResponse
+
+        app = create_app()
+        route = next(
+            r for r in app.routes if isinstance(r, APIRoute) and r.path == "/api/v1/admin/users"
+        )
+        body = UserListResponse(
+            users=[
+                UserListItem(
+                    user_id="user-123",
+                    email="test@example.com",
+                    username="testuser",
+                    is_active=True,
+                    is_superuser=False,
+                    created_at=datetime(2024, 1, 1),
+                )
+            ],
+            total=1,
+            limit=50,
+            offset=0,
+        )
+
+        value, errors = route.response_field.validate(body, {}, loc=("response",))
+
+        assert errors == []
+        assert value is body
+
 
 class TestRestApiDeps:
     """Test cases for REST API dependencies."""
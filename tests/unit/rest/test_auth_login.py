@@ -1,5 +1,8 @@
 """Tests for REST auth endpoints - login."""
 
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from fastapi.testclient import TestClient
 from rest_api.app import create_app
@@ -19,8 +22,40 @@ class TestLoginEndpoint:
     """Test cases for POST /api/v1/auth/login endpoint."""
 
     def test_login_success(self, client, app):
-        """Test successful login."""
-        pass
+        """Test successful login returns the tokens together with the profile."""
+        user = {
+            "user_id": "user-123",
+            "email": "test@example.com",
+            "username": "testuser",
+            "password_hash": "hash",
+            "is_active": True,
+            "is_superuser": False,
+            "created_at": datetime(2024, 1, 1),
+        }
+
+        with (
+            patch("rest_api.routes.auth.get_user_repository") as mock_repo,
+            patch("rest_api.routes.auth.get_auth_service") as mock_auth,
+        ):
+            mock_repo.return_value.get_by_username = AsyncMock(return_value=user)
+            mock_auth.return_value = MagicMock(
+                verify_password=MagicMock(return_value=True),
+                create_access_token=MagicMock(return_value="access"),
+                create_refresh_token=MagicMock(return_value="refresh"),
+                get_access_token_expiry=MagicMock(return_value=1800),
+            )
+
+            response = client.post(
+                "/api/v1/auth/login", json={"username": "testuser", "password": "secret"}
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["access_token"] == "access"
+        assert data["refresh_token"] == "refresh"
+        assert data["user"]["user_id"] == "user-123"
+        assert data["user"]["username"] == "testuser"
+        assert "password_hash" not in data["user"]
 
     def test_login_invalid_credentials(self, client, app):
         """Test login with invalid credentials."""
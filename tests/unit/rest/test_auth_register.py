@@ -1,5 +1,9 @@
 """Tests for REST auth endpoints - register."""
 
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from fastapi.testclient import TestClient
 from rest_api.app import create_app
@@ -22,13 +26,65 @@ class TestRegisterEndpoint:
         """Test successful user registration."""
         pass
 
-    def test_register_duplicate_email(self, client, app):
+    def test_register_duplicate_email(self, client, app, sample_user_data):
         """Test registration with duplicate email."""
-        pass
+        with patch("rest_api.routes.auth.get_user_repository") as mock_repo:
+            mock_repository = AsyncMock()
+            mock_repository.check_conflicts = AsyncMock(return_value=(False, True))
+            mock_repo.return_value = mock_repository
+
+            response = client.post("/api/v1/auth/register", json=sample_user_data)
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "EMAIL_EXISTS"
+        mock_repository.check_conflicts.assert_awaited_once_with(
+            sample_user_data["username"], sample_user_data["email"]
+        )
+        mock_repository.create.assert_not_called()
 
-    def test_register_duplicate_username(self, client, app):
+    def test_register_duplicate_username(self, client, app, sample_user_data):
         """Test registration with duplicate username."""
-        pass
+        with patch("rest_api.routes.auth.get_user_repository") as mock_repo:
+            mock_repository = AsyncMock()
+            mock_repository.check_conflicts = AsyncMock(return_value=(True, True))
+            mock_repo.return_value = mock_repository
+
+            response = client.post("/api/v1/auth/register", json=sample_user_data)
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "USERNAME_EXISTS"
+
+    def test_register_hashes_during_conflict_check(self, client, app, sample_user_data):
+        """Test that password hashing overlaps the conflict query."""
+        hashed = threading.Event()
+
+        def hash_password(password):
+            hashed.set()
+            return "hashed"
+
+        async def check_conflicts(username, email):
+            # Only returns once hashing has started alongside it.
+            assert await asyncio.to_thread(hashed.wait, 5)
+            return False, False
+
+        with (
+            patch("rest_api.routes.auth.get_user_repository") as mock_repo,
+            patch("rest_api.routes.auth.get_auth_service") as mock_auth,
+        ):
+            mock_repository = AsyncMock()
+            mock_repository.check_conflicts = AsyncMock(side_effect=check_conflicts)
+            mock_repository.create = AsyncMock(side_effect=RuntimeError("stop"))
+            mock_repo.return_value = mock_repository
+            mock_auth.return_value = MagicMock(hash_password=hash_password)
+
+            with pytest.raises(RuntimeError, match="stop"):
+                client.post("/api/v1/auth/register", json=sample_user_data)
+
+        mock_repository.create.assert_awaited_once_with(
+            username=sample_user_data["username"],
+            email=sample_user_data["email"],
+            password_hash="hashed",
+        )
 
     def test_register_invalid_email(self, client, app):
         """Test registration with invalid email."""
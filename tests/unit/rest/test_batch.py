@@ -0,0 +1,192 @@
+"""Tests for REST batch endpoint."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from rest_api.schemas import BatchResult
+from shared.db.models import Permission
+
+
+@pytest.fixture
+def collection():
+    return {
+        "collection_id": "col-1",
+        "name": "Collection 1",
+        "user_id": "user-123",
+        "qdrant_collection": "qdrant-col-1",
+        "document_count": 0,
+        "cat_count": 1,
+        "created_at": datetime(2024, 1, 1),
+        "updated_at": None,
+    }
+
+
+@pytest.fixture
+def cats():
+    return [
+        {
+            "cat_id": f"cat-{collection_id}",
+            "label": "Reader",
+            "collection_id": collection_id,
+            "collection_name": "Collection",
+            "created_at": datetime(2024, 1, 1),
+            "last_used": None,
+            "is_active": True,
+            "user_id": "user-123",
+            "permission": Permission.READ,
+            "expires_at": None,
+        }
+        for collection_id in ("col-1", "col-2")
+    ]
+
+
+class TestBatchEndpoint:
+    """Test cases for POST /api/v1/batch endpoint."""
+
+    def test_batch_resolves_input_from(self, client, as_regular_user, collection, cats):
+        """Test a call can take parameters from an earlier call's response."""
+        with (
+            patch("rest_api.routes.collections.get_collection_repository") as mock_collections,
+            patch("rest_api.routes.cat.get_cat_repository") as mock_cats,
+        ):
+            mock_collections.return_value.get_by_id = AsyncMock(return_value=collection)
+            mock_cats.return_value.list_by_user = AsyncMock(
+                side_effect=lambda user_id, collection_id=None, **kwargs: [
+                    cat for cat in cats if cat["collection_id"] == collection_id
+                ]
+            )
+
+            response = client.post(
+                "/api/v1/batch",
+                json={
+                    "calls": [
+                        {"method": "GET", "path": "/api/v1/collections/col-1"},
+                        {
+                            "method": "GET",
+                            "path": "/api/v1/auth/cat",
+                            "params": {"collection_id": "$0.collection_id"},
+                            "input_from": 0,
+                        },
+                    ]
+                },
+            )
+
+        assert response.status_code == 200
+        first, second = response.json()["results"]
+        assert first["status_code"] == 200
+        assert first["body"]["name"] == "Collection 1"
+        assert second["status_code"] == 200
+        assert [t["cat_id"] for t in second["body"]["tokens"]] == ["cat-col-1"]
+
+    def test_batch_runs_independent_calls_concurrently(self, client, as_regular_user, collection):
+        """Test calls without references are in flight at the same time."""
+        started = asyncio.Event()
+
+        async def get_by_id(collection_id):
+            # The first call only finishes once the second one has started.
+            if collection_id == "col-1":
+                await asyncio.wait_for(started.wait(), timeout=1)
+            else:
+                started.set()
+            return {**collection, "collection_id": collection_id}
+
+        with patch("rest_api.routes.collections.get_collection_repository") as mock_collections:
+            mock_collections.return_value.get_by_id = AsyncMock(side_effect=get_by_id)
+
+            response = client.post(
+                "/api/v1/batch",
+                json={
+                    "calls": [
+                        {"method": "GET", "path": "/api/v1/collections/col-1"},
+                        {"method": "GET", "path": "/api/v1/collections/col-2"},
+                    ]
+                },
+            )
+
+        assert response.status_code == 200
+        assert [r["status_code"] for r in response.json()["results"]] == [200, 200]
+
+    def test_batch_usage_counts_sub_calls_only(self, client, as_regular_user):
+        """Test a batch of N tracked calls adds N to usage, not N + 1."""
+        with (
+            patch("rest_api.middleware.usage.extract_user_id_from_token", return_value="user-123"),
+            patch("rest_api.middleware.usage.get_usage_repository") as mock_usage,
+        ):
+            mock_usage.return_value.increment = AsyncMock()
+
+            response = client.post(
+                "/api/v1/batch",
+                json={
+                    "calls": [
+                        {"method": "POST", "path": "/api/v1/documents/search", "json": {}},
+                        {"method": "POST", "path": "/api/v1/documents/search", "json": {}},
+                    ]
+                },
+            )
+
+        assert response.status_code == 200
+        assert mock_usage.return_value.increment.await_count == 2
+
+    def test_batch_sub_calls_skip_compression(self, client, as_regular_user):
+        """Test sub-calls ask for identity so GZip is not applied and then undone."""
+        seen = []
+
+        async def dispatch(sub_client, call, results):
+            seen.append(sub_client.headers["Accept-Encoding"])
+            return BatchResult(status_code=200, body=None)
+
+        with patch("rest_api.routes.batch._dispatch", side_effect=dispatch):
+            response = client.post(
+                "/api/v1/batch",
+                json={"calls": [{"method": "GET", "path": "/api/v1/collections"}]},
+            )
+
+        assert response.status_code == 200
+        assert seen == ["identity"]
+
+    def test_batch_dependency_failed(self, client, as_regular_user):
+        """Test a call is skipped when the call it depends on failed."""
+        with patch("rest_api.routes.collections.get_collection_repository") as mock_collections:
+            mock_collections.return_value.get_by_id = AsyncMock(return_value=None)
+
+            response = client.post(
+                "/api/v1/batch",
+                json={
+                    "calls": [
+                        {"method": "GET", "path": "/api/v1/collections/missing"},
+                        {
+                            "method": "GET",
+                            "path": "/api/v1/auth/cat",
+                            "params": {"collection_id": "$0.collection_id"},
+                            "input_from": 0,
+                        },
+                    ]
+                },
+            )
+
+        assert response.status_code == 200
+        first, second = response.json()["results"]
+        assert first["status_code"] == 404
+        assert second["status_code"] == 424
+        assert second["body"]["detail"]["code"] == "BATCH_DEPENDENCY_FAILED"
+
+    def test_batch_rejects_paths_outside_api(self, client, as_regular_user):
+        """Test calls must target /api/v1 endpoints other than the batch itself."""
+        for path in ("/health", "/api/v1/batch"):
+            response = client.post(
+                "/api/v1/batch",
+                json={"calls": [{"method": "GET", "path": path}]},
+            )
+            assert response.status_code == 400
+            assert response.json()["detail"]["code"] == "INVALID_BATCH_CALL"
+
+    def test_batch_unauthorized(self, client):
+        """Test batching without authentication."""
+        response = client.post(
+            "/api/v1/batch",
+            json={"calls": [{"method": "GET", "path": "/api/v1/collections"}]},
+        )
+
+        assert response.status_code == 401
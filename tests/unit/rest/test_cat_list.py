@@ -1,26 +1,71 @@
 """Tests for REST CAT endpoints - list CATs."""
 
-import pytest
-from fastapi.testclient import TestClient
-from rest_api.app import create_app
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
 
-
-@pytest.fixture
-def app():
-    return create_app()
-
-
-@pytest.fixture
-def client(app):
-    return TestClient(app)
+from shared.db.models import Permission
 
 
 class TestListCatsEndpoint:
     """Test cases for GET /api/v1/cat endpoint."""
 
-    def test_list_cats_success(self, client, app):
+    def test_list_cats_success(self, client, as_regular_user):
         """Test successful CAT token listing."""
-        pass
+        mock_cats = [
+            {
+                "cat_id": "cat-1",
+                "label": "Writer",
+                "collection_id": "col-1",
+                "collection_name": "Collection 1",
+                "created_at": datetime(2024, 1, 1),
+                "last_used": None,
+                "is_active": True,
+                "user_id": "user-123",
+                "permission": Permission.READ_WRITE,
+                "expires_at": None,
+            },
+            {
+                "cat_id": "cat-2",
+                "label": "Reader",
+                "collection_id": "col-1",
+                "collection_name": "Collection 1",
+                "created_at": datetime(2024, 1, 2),
+                "last_used": None,
+                "is_active": True,
+                "user_id": "user-123",
+                "permission": Permission.READ,
+                "expires_at": None,
+            },
+        ]
+
+        with patch("rest_api.routes.cat.get_cat_repository") as mock_repo:
+            mock_repository = AsyncMock()
+            mock_repository.list_by_user = AsyncMock(return_value=mock_cats)
+            mock_repo.return_value = mock_repository
+
+            response = client.get("/api/v1/auth/cat")
+
+        assert response.status_code == 200
+        tokens = response.json()["tokens"]
+        assert [t["permission"] for t in tokens] == ["read_write", "read"]
+        assert "user_id" not in tokens[0]
+
+    def test_list_cats_paginated(self, client, as_regular_user):
+        """Test a page of CATs is fetched from the repository with its total."""
+        with patch("rest_api.routes.cat.get_cat_repository") as mock_repo:
+            mock_repository = AsyncMock()
+            mock_repository.list_by_user = AsyncMock(return_value=[])
+            mock_repository.count_by_user = AsyncMock(return_value=30)
+            mock_repo.return_value = mock_repository
+
+            response = client.get("/api/v1/auth/cat?collection_id=col-1&limit=10&offset=20")
+
+        assert response.status_code == 200
+        assert response.json() == {"tokens": [], "total": 30, "limit": 10, "offset": 20}
+        mock_repository.list_by_user.assert_awaited_once_with(
+            "user-123", collection_id="col-1", limit=10, offset=20
+        )
+        mock_repository.count_by_user.assert_awaited_once_with("user-123", "col-1")
 
     def test_list_cats_empty(self, client, app):
         """Test listing with no CAT tokens."""
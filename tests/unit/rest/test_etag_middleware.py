@@ -0,0 +1,82 @@
+"""Tests for REST API ETag middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from rest_api.app import create_app
+from rest_api.middleware.etag import ETAG_MAX_BODY, ETagMiddleware
+
+
+@pytest.fixture
+def client():
+    return TestClient(create_app())
+
+
+@pytest.fixture
+def bare_client():
+    app = FastAPI()
+    app.add_middleware(ETagMiddleware)
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([b"chunk"]), media_type="text/plain")
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse("x" * (ETAG_MAX_BODY + 1))
+
+    return TestClient(app)
+
+
+class TestETagMiddleware:
+    """Test cases for conditional GET handling."""
+
+    def test_get_response_has_etag(self, client):
+        """Test successful GET responses carry an ETag of their body."""
+        from rest_api.middleware.etag import compute_etag
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == compute_etag(response.content)
+
+    def test_matching_if_none_match_returns_304(self, client):
+        """Test a matching If-None-Match short-circuits to an empty 304."""
+        etag = client.get("/health").headers["ETag"]
+
+        response = client.get("/health", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_stale_if_none_match_returns_body(self, client):
+        """Test a stale ETag gets the full response."""
+        response = client.get("/health", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy"}
+
+    def test_errors_have_no_etag(self, client):
+        """Test non-200 responses are passed through untouched."""
+        response = client.get("/api/v1/collections")
+
+        assert response.status_code == 401
+        assert "ETag" not in response.headers
+
+    def test_if_none_match_list_and_weak_tags(self, client):
+        """Test any tag in a list matches, compared weakly, and * matches too."""
+        etag = client.get("/health").headers["ETag"]
+
+        for header in (f'"other", {etag}', f"W/{etag}", "*"):
+            response = client.get("/health", headers={"If-None-Match": header})
+            assert response.status_code == 304, header
+
+    def test_streaming_and_large_responses_are_not_buffered(self, bare_client):
+        """Test bodies without a Content-Length or over the cap are passed through."""
+        for path in ("/stream", "/large"):
+            response = bare_client.get(path, headers={"If-None-Match": "*"})
+
+            assert response.status_code == 200
+            assert "ETag" not in response.headers
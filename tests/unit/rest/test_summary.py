@@ -0,0 +1,32 @@
+"""Tests for REST summary endpoint."""
+
+from unittest.mock import AsyncMock, patch
+
+
+class TestSummaryEndpoint:
+    """Test cases for GET /api/v1/summary endpoint."""
+
+    def test_summary_success(self, client, as_regular_user):
+        """Test the summary returns the user's counts."""
+        with (
+            patch("rest_api.routes.summary.get_collection_repository") as mock_collections,
+            patch("rest_api.routes.summary.get_document_repository") as mock_documents,
+            patch("rest_api.routes.summary.get_pat_token_repository") as mock_pats,
+            patch("rest_api.routes.summary.get_cat_repository") as mock_cats,
+        ):
+            mock_collections.return_value.count_by_user = AsyncMock(return_value=2)
+            mock_documents.return_value.count_by_user = AsyncMock(return_value=7)
+            mock_pats.return_value.count_active_by_user = AsyncMock(return_value=1)
+            mock_cats.return_value.count_active_by_user = AsyncMock(return_value=3)
+
+            response = client.get("/api/v1/summary")
+
+        assert response.status_code == 200
+        assert response.json() == {"collections": 2, "documents": 7, "pats": 1, "cats": 3}
+        mock_pats.return_value.count_active_by_user.assert_called_once_with("user-123")
+
+    def test_summary_unauthorized(self, client):
+        """Test the summary without authentication."""
+        response = client.get("/api/v1/summary")
+
+        assert response.status_code == 401
@@ -0,0 +1,105 @@
+"""Tests for the active-token counts behind the summary endpoint."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from shared.db.models import CatModel, PatTokenModel
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+NOW = datetime.utcnow()
+
+
+class _AsyncSession:
+    """Async facade over a sync session so repositories can run on SQLite."""
+
+    def __init__(self, session):
+        self._session = session
+
+    async def execute(self, statement):
+        return self._session.execute(statement)
+
+    async def delete(self, instance):
+        self._session.delete(instance)
+
+    async def commit(self):
+        self._session.commit()
+
+
+@pytest.fixture
+def session_factory():
+    """Create an in-memory database holding one user's tokens in every state."""
+    engine = create_engine("sqlite://")
+    tables = [CatModel.__table__, PatTokenModel.__table__]
+    CatModel.metadata.create_all(engine, tables=tables)
+
+    with Session(engine) as session:
+        for i, expires_at in enumerate([None, NOW + timedelta(days=1), NOW - timedelta(days=1)]):
+            session.add(
+                CatModel(
+                    id=f"cat-{i}",
+                    key_hash=f"cat-{i}",
+                    label="cat",
+                    collection_id="col-1",
+                    permission="read",
+                    user_id="user-123",
+                    expires_at=expires_at,
+                )
+            )
+            session.add(
+                PatTokenModel(
+                    id=f"pat-{i}",
+                    token_hash=f"pat-{i}",
+                    label="pat",
+                    user_id="user-123",
+                    scopes="read",
+                    expires_at=expires_at,
+                )
+            )
+        # Tokens belonging to another user must never be counted.
+        session.add(
+            CatModel(key_hash="other-cat", label="cat", collection_id="col-2", user_id="user-456")
+        )
+        session.add(PatTokenModel(token_hash="other-pat", label="pat", user_id="user-456"))
+        session.commit()
+
+    @asynccontextmanager
+    async def factory():
+        with Session(engine) as session:
+            yield _AsyncSession(session)
+
+    yield factory
+    engine.dispose()
+
+
+class TestCountActiveByUser:
+    """Test cases for CatRepository and PatTokenRepository.count_active_by_user."""
+
+    @pytest.mark.asyncio
+    async def test_cat_count_excludes_expired_and_revoked(self, session_factory):
+        """Test that expired, deleted and other users' CATs are not counted."""
+        from shared.db.repository import CatRepository
+
+        repo = CatRepository(session_factory)
+
+        assert await repo.count_active_by_user("user-123") == 2
+
+        # Revoking a CAT deletes its row.
+        assert await repo.delete("cat-0")
+
+        assert await repo.count_active_by_user("user-123") == 1
+
+    @pytest.mark.asyncio
+    async def test_pat_count_excludes_expired_and_revoked(self, session_factory):
+        """Test that expired, deleted and other users' PATs are not counted."""
+        from shared.db.repository import PatTokenRepository
+
+        repo = PatTokenRepository(session_factory)
+
+        assert await repo.count_active_by_user("user-123") == 2
+
+        # Revoking a PAT deletes its row.
+        assert await repo.delete("pat-1")
+
+        assert await repo.count_active_by_user("user-123") == 1
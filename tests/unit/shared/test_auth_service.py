@@ -103,3 +103,29 @@ class TestIsPatToken:
         assert is_pat_token("jwt_token") is False
         assert is_pat_token("cat_key") is False
         assert is_pat_token("") is False
+
+
+class TestSharedInstances:
+    """Test cases for process-wide service and repository factories."""
+
+    def test_get_auth_service_returns_shared_instance(self):
+        """Test that get_auth_service reuses one AuthService."""
+        from shared.services import get_auth_service
+
+        assert get_auth_service() is get_auth_service()
+
+    def test_get_user_repository_returns_shared_instance(self):
+        """Test that repository factories reuse one repository."""
+        from shared.db import get_document_repository, get_user_repository
+
+        assert get_user_repository() is get_user_repository()
+        assert get_document_repository() is get_document_repository()
+        assert get_document_repository("col-1").collection_id == "col-1"
+
+    def test_repository_cache_can_be_cleared(self):
+        """Test that cache_clear makes a factory build a fresh repository."""
+        from shared.db import get_user_repository
+
+        first = get_user_repository()
+        get_user_repository.cache_clear()
+        assert get_user_repository() is not first